@@ -1,6 +1,9 @@
 from lox.ast_printer import AstPrinter
 from lox.lox import Lox
 from lox.parser import Parser, ParseError
+from lox.program import Program, compile
 from lox.scanner import Scanner
+from lox.session import Session
+from lox.symbols import SymbolTable
 from lox import expressions
 from lox import tokens
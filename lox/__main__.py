@@ -1,13 +1,57 @@
+from argparse import ArgumentParser
 from sys import argv
 
 from lox.lox import Lox
+from lox.records import FORMATS
 
 
+class LoxArgumentParser(ArgumentParser):
+    def error(self, message: str) -> None:
+        print(message)
+        Lox.usage(64)
+
+
+arg_parser = LoxArgumentParser(prog='lox', add_help=False)
+arg_parser.add_argument('file', nargs='?')
+arg_parser.add_argument('--tune-gc', action='store_true')
+arg_parser.add_argument('--format', choices=FORMATS)
+
+modes = arg_parser.add_mutually_exclusive_group()
+modes.add_argument('--stats', action='store_const', const='text')
+modes.add_argument('--stats-json', dest='stats', action='store_const', const='json')
+modes.add_argument('--coverage', metavar='report')
+modes.add_argument('--profile', metavar='stacks')
+modes.add_argument('--snapshot', metavar='snapshot')
+modes.add_argument('--restore', metavar='snapshot')
+modes.add_argument('--filter', dest='records', type=lambda expr: ('filter', expr))
+modes.add_argument('--map', dest='records', type=lambda expr: ('map', expr))
+
 def main(args) -> None:
-    if len(args) > 1:
+    options = arg_parser.parse_args(args)
+    has_mode = any((options.records, options.stats, options.coverage,
+                    options.profile, options.snapshot, options.restore))
+
+    if options.tune_gc and (has_mode or not options.file):
+        Lox.usage(64)
+    elif options.format and not options.records:
+        Lox.usage(64)
+    elif options.records:
+        mode, expression = options.records
+        Lox.run_records(expression, mode, options.format or FORMATS[0], options.file)
+    elif (options.stats or options.coverage or options.profile or options.snapshot) and not options.file:
         Lox.usage(64)
-    elif len(args) == 1:
-        Lox.run_file(args[0])
+    elif options.profile:
+        Lox.run_file_with_profile(options.file, options.profile)
+    elif options.restore:
+        Lox.restore(options.restore, options.file)
+    elif options.snapshot:
+        Lox.run_file_with_snapshot(options.file, options.snapshot)
+    elif options.coverage:
+        Lox.run_file_with_coverage(options.file, options.coverage)
+    elif options.stats:
+        Lox.run_file_with_stats(options.file, options.stats)
+    elif options.file:
+        Lox.run_file(options.file, options.tune_gc)
     else:
         Lox.prompt()
 
@@ -0,0 +1,51 @@
+from asyncio import StreamWriter, sleep
+from io import StringIO
+from sys import stdout
+from typing import Optional, Sequence
+
+from lox import statements
+from lox.environment import Environment
+from lox.interpreter import Interpreter
+
+
+class AsyncInterpreter(Interpreter):
+    def __init__(
+            self,
+            environment: Optional[Environment] = None,
+            stream: Optional[StreamWriter] = None,
+            max_steps: Optional[int] = None,
+            timeout: Optional[float] = None,
+            yield_interval: int = 64
+    ) -> None:
+        super().__init__(environment, StringIO(), max_steps, timeout)
+        self.stream = stream
+        self.yield_interval = yield_interval
+
+    async def flush(self) -> None:
+        text = self.output.getvalue()
+
+        if not text:
+            return
+
+        self.output.seek(0)
+        self.output.truncate()
+
+        if self.stream is None:
+            stdout.write(text)
+        else:
+            self.stream.write(text.encode('utf-8'))
+            await self.stream.drain()
+
+    async def interpret_async(self, stmts: Sequence[statements.Stmt]) -> None:
+        self.reset_budget()
+
+        try:
+            for index, stmt in enumerate(stmts, 1):
+                self.statement = stmt
+                self.execute(stmt)
+
+                if index % self.yield_interval == 0:
+                    await self.flush()
+                    await sleep(0)
+        finally:
+            await self.flush()
@@ -0,0 +1,256 @@
+from array import array
+from enum import IntEnum
+from typing import Any, Dict, List, Optional, Sequence, TextIO, Tuple
+
+from lox import expressions, statements
+from lox.environment import Environment
+from lox.errors import LoxRuntimeError
+from lox.interpreter import Interpreter
+from lox.parser import NodeFactory, Parser
+from lox.rope import concatenate
+from lox.scanner import Scanner
+from lox.source import SourceMap
+from lox.tokens import Token, TokenType
+
+TOKEN_TYPES: List[TokenType] = list(TokenType)
+
+TOKEN_CODES: Dict[TokenType, int] = {typ: code for code, typ in enumerate(TOKEN_TYPES)}
+
+NO_NODE = -1
+
+
+class NodeKind(IntEnum):
+    LITERAL = 0
+    GROUPING = 1
+    VARIABLE = 2
+    UNARY = 3
+    BINARY = 4
+    PRINT = 5
+    EXPRESSION = 6
+
+
+class Arena(NodeFactory):
+    def __init__(self, source_map: SourceMap) -> None:
+        self.source_map = source_map
+        self.kinds = array('B')
+        self.lefts = array('i')
+        self.rights = array('i')
+        self.operators = array('B')
+        self.operator_starts = array('i')
+        self.starts = array('i')
+        self.ends = array('i')
+        self.literals: List[Any] = []
+        self.literal_ids: Dict[Tuple[type, Any], int] = {}
+        self.statements = array('i')
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def add(
+            self,
+            kind: NodeKind,
+            left: int,
+            right: int,
+            operator: Optional[Token],
+            first: Token,
+            last: Token
+    ) -> int:
+        self.kinds.append(kind)
+        self.lefts.append(left)
+        self.rights.append(right)
+        self.operators.append(TOKEN_CODES[operator.type] if operator else 0)
+        self.operator_starts.append(operator.start if operator else first.start)
+        self.starts.append(first.start)
+        self.ends.append(last.end)
+
+        return len(self.kinds) - 1
+
+    def literal(self, value: Any, first: Token, last: Token) -> int:
+        key = (type(value), value)
+        index = self.literal_ids.get(key)
+
+        if index is None:
+            index = len(self.literals)
+            self.literal_ids[key] = index
+            self.literals.append(value)
+
+        return self.add(NodeKind.LITERAL, index, NO_NODE, None, first, last)
+
+    def grouping(self, expression: int, first: Token, last: Token) -> int:
+        return self.add(NodeKind.GROUPING, expression, NO_NODE, None, first, last)
+
+    def variable(self, name: Token) -> int:
+        return self.add(NodeKind.VARIABLE, NO_NODE, NO_NODE, name, name, name)
+
+    def unary(self, operator: Token, right: int, last: Token) -> int:
+        return self.add(NodeKind.UNARY, right, NO_NODE, operator, operator, last)
+
+    def binary(self, left: int, operator: Token, right: int, first: Token, last: Token) -> int:
+        return self.add(NodeKind.BINARY, left, right, operator, first, last)
+
+    def print_stmt(self, expression: int, first: Token, last: Token) -> int:
+        return self.add(NodeKind.PRINT, expression, NO_NODE, None, first, last)
+
+    def expression_stmt(self, expression: int, first: Token, last: Token) -> int:
+        return self.add(NodeKind.EXPRESSION, expression, NO_NODE, None, first, last)
+
+    def token(self, index: int) -> Token:
+        typ = TOKEN_TYPES[self.operators[index]]
+        start = self.operator_starts[index]
+
+        if self.kinds[index] == NodeKind.VARIABLE:
+            end = self.ends[index]
+            lexeme = self.source_map.text[start:end]
+        else:
+            lexeme = typ.value
+            end = start + len(lexeme)
+
+        return Token(typ, lexeme, None, start, end, self.source_map)
+
+    def expression(self, index: int) -> expressions.Expr:
+        kind = self.kinds[index]
+
+        if kind == NodeKind.LITERAL:
+            expr = expressions.Literal(self.literals[self.lefts[index]])
+        elif kind == NodeKind.GROUPING:
+            expr = expressions.Grouping(self.expression(self.lefts[index]))
+        elif kind == NodeKind.VARIABLE:
+            expr = expressions.Variable(self.token(index))
+        elif kind == NodeKind.UNARY:
+            expr = expressions.Unary(self.token(index), self.expression(self.lefts[index]))
+        elif kind == NodeKind.BINARY:
+            expr = expressions.Binary(self.expression(self.lefts[index]),
+                                      self.token(index),
+                                      self.expression(self.rights[index]))
+        else:
+            raise ValueError(f'node {index} is not an expression')
+
+        expr.start = self.starts[index]
+        expr.end = self.ends[index]
+
+        return expr
+
+    def statement(self, index: int) -> statements.Stmt:
+        kind = self.kinds[index]
+        expression = self.expression(self.lefts[index])
+
+        if kind == NodeKind.PRINT:
+            stmt = statements.Print(expression)
+        elif kind == NodeKind.EXPRESSION:
+            stmt = statements.Expression(expression)
+        else:
+            raise ValueError(f'node {index} is not a statement')
+
+        stmt.start = self.starts[index]
+        stmt.end = self.ends[index]
+        stmt.source_map = self.source_map
+
+        return stmt
+
+    def to_statements(self) -> List[statements.Stmt]:
+        return [self.statement(index) for index in self.statements]
+
+
+def parse_arena(source: str) -> Arena:
+    scanner = Scanner(source)
+    tokens = scanner.scan_tokens()
+    arena = Arena(scanner.source_map)
+    arena.statements = array('i', Parser(tokens, arena).parse())
+
+    return arena
+
+
+class ArenaInterpreter(Interpreter):
+    def __init__(
+            self,
+            arena: Arena,
+            environment: Optional[Environment] = None,
+            output: Optional[TextIO] = None
+    ) -> None:
+        super().__init__(environment, output)
+        self.arena = arena
+
+    def error(self, index: int, message: str) -> LoxRuntimeError:
+        return LoxRuntimeError(self.arena.token(index), message)
+
+    def evaluate_node(self, index: int) -> Any:
+        arena = self.arena
+        kind = arena.kinds[index]
+
+        if kind == NodeKind.LITERAL:
+            return arena.literals[arena.lefts[index]]
+        elif kind == NodeKind.GROUPING:
+            return self.evaluate_node(arena.lefts[index])
+        elif kind == NodeKind.VARIABLE:
+            name = arena.source_map.text[arena.starts[index]:arena.ends[index]]
+
+            try:
+                return self.environment.values[name]
+            except KeyError:
+                raise self.error(index, f"Undefined variable '{name}'.") from None
+        elif kind == NodeKind.UNARY:
+            return self.evaluate_unary(index)
+
+        return self.evaluate_binary(index)
+
+    def evaluate_unary(self, index: int) -> Any:
+        right = self.evaluate_node(self.arena.lefts[index])
+        token_type = TOKEN_TYPES[self.arena.operators[index]]
+
+        if token_type == TokenType.BANG:
+            return not self.is_truthy(right)
+        elif token_type == TokenType.MINUS:
+            if not self.is_number(right):
+                raise self.error(index, 'Operand must be a numeric object.')
+
+            return -right
+
+        return None
+
+    def evaluate_binary(self, index: int) -> Any:
+        left = self.evaluate_node(self.arena.lefts[index])
+        right = self.evaluate_node(self.arena.rights[index])
+        token_type = TOKEN_TYPES[self.arena.operators[index]]
+
+        if token_type == TokenType.BANG_EQUAL:
+            return not self.is_equal(left, right)
+        elif token_type == TokenType.EQUAL_EQUAL:
+            return self.is_equal(left, right)
+        elif token_type == TokenType.PLUS:
+            if self.is_number(left) and self.is_number(right):
+                return left + right
+
+            if self.is_string(left) and self.is_string(right):
+                return concatenate(left, right)
+
+            raise self.error(index, 'Operands must be two strings or two numeric objects.')
+
+        if not (self.is_number(left) and self.is_number(right)):
+            raise self.error(index, 'Operands must be numeric objects.')
+
+        if token_type == TokenType.GREATER:
+            return left > right
+        elif token_type == TokenType.GREATER_EQUAL:
+            return left >= right
+        elif token_type == TokenType.LESS:
+            return left < right
+        elif token_type == TokenType.LESS_EQUAL:
+            return left <= right
+        elif token_type == TokenType.MINUS:
+            return left - right
+        elif token_type == TokenType.SLASH:
+            return left / right
+        elif token_type == TokenType.STAR:
+            return left * right
+
+        return None
+
+    def execute_node(self, index: int) -> None:
+        value = self.evaluate_node(self.arena.lefts[index])
+
+        if self.arena.kinds[index] == NodeKind.PRINT:
+            print(self.stringify(value), file=self.output)
+
+    def interpret_arena(self, roots: Optional[Sequence[int]] = None) -> None:
+        for index in self.arena.statements if roots is None else roots:
+            self.execute_node(index)
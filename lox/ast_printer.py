@@ -1,6 +1,10 @@
+from typing import Any, List, Optional, Sequence, TextIO, Tuple, Union
+
 from lox import expressions
 from lox.tokens import Token, TokenType
 
+Description = Union[str, Tuple[str, Sequence[Any]]]
+
 
 class AstPrinter(expressions.ExprVisitor):
     def print(self, expr: expressions.Expr):
@@ -49,15 +53,105 @@ class AstPrinter(expressions.ExprVisitor):
         return expr.name.lexeme
 
 
+class StreamingAstPrinter(expressions.ExprVisitor):
+    def __init__(self, stream: TextIO, indent: Optional[int] = None) -> None:
+        self.stream = stream
+        self.indent = indent
+
+    def print(self, expr: expressions.Expr) -> None:
+        write = self.stream.write
+        pending: List[Tuple[Any, int]] = [(expr, 0)]
+
+        while pending:
+            item, depth = pending.pop()
+
+            if isinstance(item, str):
+                write(item)
+                continue
+
+            description = self.describe(item)
+
+            if isinstance(description, str):
+                write(description)
+                continue
+
+            name, children = description
+            write(f'({name}')
+            pending.append((')', depth))
+
+            for child in reversed(children):
+                pending.append((child, depth + 1))
+                pending.append((self.separator(depth + 1), depth))
+
+    def separator(self, depth: int) -> str:
+        if self.indent is None:
+            return ' '
+
+        return '\n' + ' ' * (self.indent * depth)
+
+    def describe(self, item: Any) -> Description:
+        if isinstance(item, expressions.Expr):
+            return item.accept(self)
+
+        if isinstance(item, Token):
+            return item.lexeme
+
+        if isinstance(item, list):
+            return 'args', item
+
+        return str(item)
+
+    def visit_assign_expr(self, expr: expressions.Assign) -> Description:
+        return '=', (expr.name, expr.value)
+
+    def visit_binary_expr(self, expr: expressions.Binary) -> Description:
+        return expr.operator.lexeme, (expr.left, expr.right)
+
+    def visit_call_expr(self, expr: expressions.Call) -> Description:
+        return 'call', (expr.callee, *expr.arguments)
+
+    def visit_get_expr(self, expr: expressions.Get) -> Description:
+        return '.', (expr.obj, expr.name)
+
+    def visit_grouping_expr(self, expr: expressions.Grouping) -> Description:
+        return 'group', (expr.expression,)
+
+    def visit_literal_expr(self, expr: expressions.Literal) -> Description:
+        return str(expr.value)
+
+    def visit_logical_expr(self, expr: expressions.Logical) -> Description:
+        return f'logical {expr.operator.lexeme}', (expr.left, expr.right)
+
+    def visit_this_expr(self, expr: expressions.This) -> Description:
+        return 'this'
+
+    def visit_set_expr(self, expr: expressions.Set) -> Description:
+        return '=', (expr.obj, expr.name, expr.value)
+
+    def visit_super_expr(self, expr: expressions.Super) -> Description:
+        return 'super', (expr.method,)
+
+    def visit_unary_expr(self, expr: expressions.Unary) -> Description:
+        return expr.operator.lexeme, (expr.right,)
+
+    def visit_variable_expr(self, expr: expressions.Variable) -> Description:
+        return expr.name.lexeme
+
+
 if __name__ == '__main__':
+    from sys import stdout
+
     exp = expressions.Binary(
         expressions.Unary(
-            Token(TokenType.MINUS, '-', '', 1),
+            Token(TokenType.MINUS, '-', '', 0, 1),
             expressions.Literal(123)
         ),
-        Token(TokenType.STAR, '*', '', 1),
+        Token(TokenType.STAR, '*', '', 5, 6),
         expressions.Grouping(expressions.Literal(45.67))
     )
 
     printer = AstPrinter()
     print(printer.print(exp))
+
+    StreamingAstPrinter(stdout, indent=2).print(exp)
+    print()
@@ -0,0 +1,87 @@
+from typing import Dict, List, Optional, TextIO, Tuple
+
+from lox import expressions, statements
+from lox.environment import Environment
+from lox.interpreter import Interpreter
+from lox.parser import NodeFactory, Parser
+from lox.scanner import Scanner
+from lox.tokens import Token
+
+
+class CoverageNodeFactory(NodeFactory):
+    def __init__(self) -> None:
+        self.statements: List[statements.Stmt] = []
+
+    def register(self, stmt: statements.Stmt) -> statements.Stmt:
+        stmt.index = len(self.statements)
+        self.statements.append(stmt)
+
+        return stmt
+
+    def print_stmt(self, expression: expressions.Expr, first: Token, last: Token) -> statements.Stmt:
+        return self.register(super().print_stmt(expression, first, last))
+
+    def expression_stmt(
+            self,
+            expression: expressions.Expr,
+            first: Token,
+            last: Token
+    ) -> statements.Stmt:
+        return self.register(super().expression_stmt(expression, first, last))
+
+
+class Coverage:
+    def __init__(self, factory: CoverageNodeFactory) -> None:
+        self.statements = factory.statements
+        self.hits = bytearray(len(self.statements))
+
+    def lines(self) -> Dict[int, int]:
+        lines: Dict[int, int] = {}
+
+        for stmt, hit in zip(self.statements, self.hits):
+            line = stmt.source_map.line(stmt.start) if stmt.source_map else 1
+            lines[line] = max(lines.get(line, 0), hit)
+
+        return lines
+
+    def write_lcov(self, stream: TextIO, path: str, test_name: str = '') -> None:
+        lines = self.lines()
+
+        stream.write(f'TN:{test_name}\n')
+        stream.write(f'SF:{path}\n')
+
+        for line in sorted(lines):
+            stream.write(f'DA:{line},{lines[line]}\n')
+
+        stream.write(f'LF:{len(lines)}\n')
+        stream.write(f'LH:{sum(1 for hit in lines.values() if hit)}\n')
+        stream.write('end_of_record\n')
+
+
+def parse_with_coverage(source: str) -> Tuple[List[statements.Stmt], Coverage]:
+    factory = CoverageNodeFactory()
+    stmts = Parser(Scanner(source).scan_tokens(), factory).parse()
+
+    return stmts, Coverage(factory)
+
+
+class CoverageInterpreter(Interpreter):
+    def __init__(
+            self,
+            coverage: Coverage,
+            environment: Optional[Environment] = None,
+            output: Optional[TextIO] = None,
+            max_steps: Optional[int] = None,
+            timeout: Optional[float] = None
+    ) -> None:
+        super().__init__(environment, output, max_steps, timeout)
+        self.coverage = coverage
+        self.hits = coverage.hits
+
+    def execute(self, stmt: statements.Stmt) -> None:
+        self.hits[stmt.index] = 1
+        stmt.accept(self)
+
+    def budgeted_execute(self, stmt: statements.Stmt) -> None:
+        self.hits[stmt.index] = 1
+        super().budgeted_execute(stmt)
@@ -0,0 +1,100 @@
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, TextIO
+
+from lox import expressions, statements
+from lox.environment import Environment
+from lox.interpreter import Interpreter
+
+MISSING = object()
+
+
+class CommonSubexpressions:
+    def __init__(self) -> None:
+        self.keys: Dict[Hashable, List[expressions.Expr]] = {}
+
+    def key(self, expr: expressions.Expr) -> Optional[Hashable]:
+        if isinstance(expr, expressions.Literal):
+            return 'literal', type(expr.value), expr.value
+
+        if isinstance(expr, expressions.Grouping):
+            inner = self.key(expr.expression)
+            key = None if inner is None else ('group', inner)
+        elif isinstance(expr, expressions.Unary):
+            right = self.key(expr.right)
+            key = None if right is None else ('unary', expr.operator.type, right)
+        elif isinstance(expr, expressions.Binary):
+            left = self.key(expr.left)
+            right = self.key(expr.right)
+
+            if left is None or right is None:
+                key = None
+            else:
+                key = ('binary', expr.operator.type, left, right)
+        else:
+            for child in vars(expr).values():
+                if isinstance(child, expressions.Expr):
+                    self.key(child)
+
+            return None
+
+        if key is not None:
+            self.keys.setdefault(key, []).append(expr)
+
+        return key
+
+    def analyze(self, stmts: Sequence[statements.Stmt]) -> Dict[int, int]:
+        for stmt in stmts:
+            for child in vars(stmt).values():
+                if isinstance(child, expressions.Expr):
+                    self.key(child)
+
+        slots: Dict[int, int] = {}
+        repeated = (occurrences for occurrences in self.keys.values() if len(occurrences) > 1)
+
+        for slot, occurrences in enumerate(repeated):
+            for expr in occurrences:
+                slots[id(expr)] = slot
+
+        return slots
+
+
+class MemoizingInterpreter(Interpreter):
+    def __init__(
+            self,
+            stmts: Sequence[statements.Stmt],
+            environment: Optional[Environment] = None,
+            output: Optional[TextIO] = None,
+            max_steps: Optional[int] = None,
+            timeout: Optional[float] = None
+    ) -> None:
+        super().__init__(environment, output, max_steps, timeout)
+        self.stmts = stmts
+        self.slots = CommonSubexpressions().analyze(stmts)
+        self.slot_count = max(self.slots.values(), default=-1) + 1
+        self.values: List[Any] = []
+
+    def interpret(self, stmts: Optional[Sequence[statements.Stmt]] = None) -> None:
+        self.values = [MISSING] * self.slot_count
+        super().interpret(self.stmts if stmts is None else stmts)
+
+    def memoized(self, expr: expressions.Expr, compute: Callable[[Any], Any]) -> Any:
+        slot = self.slots.get(id(expr))
+
+        if slot is None:
+            return compute(expr)
+
+        value = self.values[slot]
+
+        if value is MISSING:
+            value = compute(expr)
+            self.values[slot] = value
+
+        return value
+
+    def visit_binary_expr(self, expr: expressions.Binary) -> Any:
+        return self.memoized(expr, super().visit_binary_expr)
+
+    def visit_grouping_expr(self, expr: expressions.Grouping) -> Any:
+        return self.memoized(expr, super().visit_grouping_expr)
+
+    def visit_unary_expr(self, expr: expressions.Unary) -> Any:
+        return self.memoized(expr, super().visit_unary_expr)
@@ -0,0 +1,24 @@
+from typing import Any, Dict, Optional
+
+from lox.errors import LoxRuntimeError
+from lox.tokens import Token
+
+
+class Environment:
+    def __init__(self, values: Optional[Dict[str, Any]] = None) -> None:
+        self.values: Dict[str, Any] = {} if values is None else values
+
+    def define(self, name: str, value: Any) -> None:
+        self.values[name] = value
+
+    def get(self, name: Token) -> Any:
+        try:
+            return self.values[name.lexeme]
+        except KeyError:
+            raise LoxRuntimeError(name, f"Undefined variable '{name.lexeme}'.") from None
+
+    def assign(self, name: Token, value: Any) -> None:
+        if name.lexeme not in self.values:
+            raise LoxRuntimeError(name, f"Undefined variable '{name.lexeme}'.")
+
+        self.values[name.lexeme] = value
@@ -0,0 +1,17 @@
+from lox.tokens import Token
+
+
+class LoxRuntimeError(RuntimeError):
+    def __init__(self, token: Token, message: str) -> None:
+        super().__init__(message)
+        self.token = token
+
+    def __str__(self) -> str:
+        return super().__str__()
+
+    def __repr__(self) -> str:
+        return super().__repr__()
+
+
+class BudgetExceeded(LoxRuntimeError):
+    pass
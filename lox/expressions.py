@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Any, List
+from typing import Any, List, Optional
 
+from lox.source import SourceMap
 from lox.tokens import Token
 
 
@@ -55,6 +56,10 @@ class ExprVisitor(ABC):
 
 
 class Expr(ABC):
+    start: int = 0
+    end: int = 0
+    source_map: Optional[SourceMap] = None
+
     @abstractmethod
     def accept(self, visitor: ExprVisitor):
         pass
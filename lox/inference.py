@@ -0,0 +1,148 @@
+import operator
+from typing import Any, Callable, Dict, Optional, Sequence, TextIO
+
+from lox import expressions, statements
+from lox.environment import Environment
+from lox.interpreter import Interpreter
+from lox.rope import concatenate
+from lox.tokens import TokenType
+
+NUMBER = 'number'
+STRING = 'string'
+NULL = 'null'
+
+ARITHMETIC: Dict[TokenType, Callable[[Any, Any], Any]] = {
+    TokenType.MINUS: operator.sub,
+    TokenType.PLUS: operator.add,
+    TokenType.SLASH: operator.truediv,
+    TokenType.STAR: operator.mul,
+}
+
+COMPARISONS: Dict[TokenType, Callable[[Any, Any], Any]] = {
+    TokenType.GREATER: operator.gt,
+    TokenType.GREATER_EQUAL: operator.ge,
+    TokenType.LESS: operator.lt,
+    TokenType.LESS_EQUAL: operator.le,
+}
+
+EQUALITY: Dict[TokenType, Callable[[Any, Any], Any]] = {
+    TokenType.EQUAL_EQUAL: operator.eq,
+    TokenType.BANG_EQUAL: operator.ne,
+}
+
+
+class TypeInference:
+    def __init__(self) -> None:
+        self.handlers: Dict[int, Callable] = {}
+
+    @staticmethod
+    def literal_type(value: Any) -> Optional[str]:
+        if value is None:
+            return NULL
+
+        if isinstance(value, (bool, int, float)):
+            return NUMBER
+
+        if isinstance(value, str):
+            return STRING
+
+        return None
+
+    def infer(self, expr: expressions.Expr) -> Optional[str]:
+        if isinstance(expr, expressions.Literal):
+            return self.literal_type(expr.value)
+
+        if isinstance(expr, expressions.Grouping):
+            return self.infer(expr.expression)
+
+        if isinstance(expr, expressions.Unary):
+            return self.infer_unary(expr)
+
+        if isinstance(expr, expressions.Binary):
+            return self.infer_binary(expr)
+
+        for child in vars(expr).values():
+            if isinstance(child, expressions.Expr):
+                self.infer(child)
+
+        return None
+
+    def infer_unary(self, expr: expressions.Unary) -> Optional[str]:
+        right = self.infer(expr.right)
+
+        if expr.operator.type == TokenType.BANG:
+            self.handlers[id(expr)] = operator.not_
+            return NUMBER
+
+        if expr.operator.type == TokenType.MINUS and right == NUMBER:
+            self.handlers[id(expr)] = operator.neg
+            return NUMBER
+
+        return None
+
+    def infer_binary(self, expr: expressions.Binary) -> Optional[str]:
+        left = self.infer(expr.left)
+        right = self.infer(expr.right)
+        token_type = expr.operator.type
+
+        if token_type in EQUALITY:
+            self.handlers[id(expr)] = EQUALITY[token_type]
+            return NUMBER
+
+        if token_type == TokenType.PLUS and left == right == STRING:
+            self.handlers[id(expr)] = concatenate
+            return STRING
+
+        if left != NUMBER or right != NUMBER:
+            return None
+
+        if token_type in COMPARISONS:
+            self.handlers[id(expr)] = COMPARISONS[token_type]
+            return NUMBER
+
+        if token_type in ARITHMETIC:
+            self.handlers[id(expr)] = ARITHMETIC[token_type]
+            return NUMBER
+
+        return None
+
+    def analyze(self, stmts: Sequence[statements.Stmt]) -> Dict[int, Callable]:
+        for stmt in stmts:
+            for child in vars(stmt).values():
+                if isinstance(child, expressions.Expr):
+                    self.infer(child)
+
+        return self.handlers
+
+
+class TypedInterpreter(Interpreter):
+    def __init__(
+            self,
+            stmts: Sequence[statements.Stmt],
+            environment: Optional[Environment] = None,
+            output: Optional[TextIO] = None,
+            max_steps: Optional[int] = None,
+            timeout: Optional[float] = None
+    ) -> None:
+        super().__init__(environment, output, max_steps, timeout)
+        self.stmts = stmts
+        self.handlers = TypeInference().analyze(stmts)
+
+    def interpret(self, stmts: Optional[Sequence[statements.Stmt]] = None) -> None:
+        super().interpret(self.stmts if stmts is None else stmts)
+
+    def visit_binary_expr(self, expr: expressions.Binary) -> Any:
+        handler = self.handlers.get(id(expr))
+
+        if handler is None:
+            return super().visit_binary_expr(expr)
+
+        return handler(self.evaluate(expr.left), self.evaluate(expr.right))
+
+    def visit_unary_expr(self, expr: expressions.Unary) -> Any:
+        handler = self.handlers.get(id(expr))
+
+        if handler is None:
+            return super().visit_unary_expr(expr)
+
+        return handler(self.evaluate(expr.right))
@@ -0,0 +1,129 @@
+from array import array
+from bisect import bisect_left
+from typing import Any, Dict, Hashable, List, Optional, Sequence, TextIO, Tuple
+
+from lox import expressions, statements
+from lox.environment import Environment
+from lox.errors import LoxRuntimeError
+from lox.interpreter import Interpreter
+from lox.parser import NodeFactory, Parser
+from lox.scanner import Scanner
+from lox.tokens import Token
+
+
+class InterningNodeFactory(NodeFactory):
+    def __init__(self) -> None:
+        self.nodes: Dict[Hashable, expressions.Expr] = {}
+        self.occurrences: Dict[int, array] = {}
+
+    def share(self, key: Hashable, node: expressions.Expr) -> expressions.Expr:
+        self.nodes[key] = node
+        return node
+
+    def record(self, shared: Token, occurrence: Token) -> None:
+        starts = self.occurrences.get(id(shared))
+
+        if starts is None:
+            starts = self.occurrences[id(shared)] = array('i')
+
+        starts.append(occurrence.start)
+
+    def literal(self, value: Any, first: Token, last: Token) -> expressions.Expr:
+        key = ('literal', type(value), value)
+        node = self.nodes.get(key)
+
+        if node is None:
+            node = self.share(key, super().literal(value, first, last))
+
+        return node
+
+    def grouping(self, expression: expressions.Expr, first: Token, last: Token) -> expressions.Expr:
+        key = ('grouping', id(expression))
+        node = self.nodes.get(key)
+
+        if node is None:
+            node = self.share(key, super().grouping(expression, first, last))
+
+        return node
+
+    def variable(self, name: Token) -> expressions.Expr:
+        key = ('variable', name.lexeme)
+        node = self.nodes.get(key)
+
+        if node is None:
+            node = self.share(key, super().variable(name))
+
+        self.record(node.name, name)
+        return node
+
+    def unary(self, operator: Token, right: expressions.Expr, last: Token) -> expressions.Expr:
+        key = ('unary', operator.type, id(right))
+        node = self.nodes.get(key)
+
+        if node is None:
+            node = self.share(key, super().unary(operator, right, last))
+
+        self.record(node.operator, operator)
+        return node
+
+    def binary(
+            self,
+            left: expressions.Expr,
+            operator: Token,
+            right: expressions.Expr,
+            first: Token,
+            last: Token
+    ) -> expressions.Expr:
+        key = ('binary', id(left), operator.type, id(right))
+        node = self.nodes.get(key)
+
+        if node is None:
+            node = self.share(key, super().binary(left, operator, right, first, last))
+
+        self.record(node.operator, operator)
+        return node
+
+    def relocate(self, token: Token, stmt: Optional[statements.Stmt]) -> Token:
+        if stmt is None:
+            return token
+
+        starts = self.occurrences.get(id(token))
+
+        if starts is not None:
+            index = bisect_left(starts, stmt.start)
+
+            if index < len(starts) and starts[index] < stmt.end:
+                start = starts[index]
+                return Token(token.type, token.lexeme, token.literal,
+                             start, start + token.end - token.start, token.source)
+
+        if stmt.start <= token.start < stmt.end:
+            return token
+
+        return Token(token.type, token.lexeme, token.literal, stmt.start, stmt.end, stmt.source_map)
+
+
+def parse_interned(source: str) -> Tuple[List[statements.Stmt], InterningNodeFactory]:
+    factory = InterningNodeFactory()
+    stmts = Parser(Scanner(source).scan_tokens(), factory).parse()
+
+    return stmts, factory
+
+
+class InterningInterpreter(Interpreter):
+    def __init__(
+            self,
+            factory: InterningNodeFactory,
+            environment: Optional[Environment] = None,
+            output: Optional[TextIO] = None,
+            max_steps: Optional[int] = None,
+            timeout: Optional[float] = None
+    ) -> None:
+        super().__init__(environment, output, max_steps, timeout)
+        self.factory = factory
+
+    def interpret(self, stmts: Sequence[statements.Stmt]) -> None:
+        try:
+            super().interpret(stmts)
+        except LoxRuntimeError as lre:
+            raise type(lre)(self.factory.relocate(lre.token, self.statement), str(lre)) from None
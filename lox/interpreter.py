@@ -1,30 +1,107 @@
-from typing import Any, List
+from sys import maxsize
+from time import monotonic
+from typing import Any, Optional, Sequence, TextIO, Union
 
 from lox import expressions, statements
+from lox.environment import Environment
+from lox.errors import BudgetExceeded, LoxRuntimeError
+from lox.rope import Rope, concatenate
 from lox.tokens import TokenType, Token
 
 
-class LoxRuntimeError(RuntimeError):
-    def __init__(self, token: Token, message: str) -> None:
-        super().__init__(message)
-        self.token = token
+class Interpreter(expressions.ExprVisitor, statements.StmtVisitor):
+    def __init__(
+            self,
+            environment: Optional[Environment] = None,
+            output: Optional[TextIO] = None,
+            max_steps: Optional[int] = None,
+            timeout: Optional[float] = None,
+            check_interval: int = 1024
+    ) -> None:
+        self.environment = Environment() if environment is None else environment
+        self.output = output
+        self.max_steps = max_steps
+        self.timeout = timeout
+        self.check_interval = check_interval
+        self.reset_budget()
+
+        if max_steps is not None or timeout is not None:
+            self.evaluate = self.budgeted_evaluate
+            self.execute = self.budgeted_execute
+
+    def reset_budget(self) -> None:
+        self.statement: Optional[statements.Stmt] = None
+        self.steps_taken = 0
+        self.deadline = None if self.timeout is None else monotonic() + self.timeout
+        self.interval = self.next_interval()
+        self.countdown = self.interval
+
+    def next_interval(self) -> int:
+        interval = maxsize if self.timeout is None else self.check_interval
+
+        if self.max_steps is not None:
+            interval = min(interval, self.max_steps - self.steps_taken)
+
+        return interval
+
+    def check_budget(self, node: Union[expressions.Expr, statements.Stmt]) -> None:
+        self.steps_taken += self.interval
+
+        if self.max_steps is not None and self.steps_taken >= self.max_steps:
+            raise BudgetExceeded(self.locate(node),
+                                 f'Execution budget of {self.max_steps} steps exceeded.')
+
+        if self.deadline is not None and monotonic() > self.deadline:
+            raise BudgetExceeded(self.locate(node),
+                                 f'Execution deadline of {self.timeout} seconds exceeded.')
+
+        self.interval = self.next_interval()
+        self.countdown = self.interval - 1
+
+    def locate(self, node: Union[expressions.Expr, statements.Stmt]) -> Token:
+        pending = [node]
+
+        while pending:
+            attributes = list(vars(pending.pop()).values())
+
+            for attribute in attributes:
+                if isinstance(attribute, Token):
+                    return attribute
+
+            pending.extend(reversed([attribute
+                                     for attribute in attributes
+                                     if isinstance(attribute, (expressions.Expr, statements.Stmt))]))
+
+        source_map = self.statement.source_map if self.statement else node.source_map
+        return Token(TokenType.EOF, TokenType.EOF.value, None, node.start, node.end, source_map)
 
-    def __str__(self) -> str:
-        return super().__str__()
+    def evaluate(self, expr: expressions.Expr) -> Any:
+        return expr.accept(self)
 
-    def __repr__(self) -> str:
-        return super().__repr__()
+    def execute(self, stmt: statements.Stmt) -> None:
+        stmt.accept(self)
 
+    def budgeted_evaluate(self, expr: expressions.Expr) -> Any:
+        self.countdown -= 1
+
+        if self.countdown < 0:
+            self.check_budget(expr)
 
-class Interpreter(expressions.ExprVisitor, statements.StmtVisitor):
-    def evaluate(self, expr: expressions.Expr) -> Any:
         return expr.accept(self)
 
-    def execute(self, stmt: statements.Stmt) -> None:
+    def budgeted_execute(self, stmt: statements.Stmt) -> None:
+        self.countdown -= 1
+
+        if self.countdown < 0:
+            self.check_budget(stmt)
+
         stmt.accept(self)
 
-    def interpret(self, stmts: List[statements.Stmt]) -> None:
+    def interpret(self, stmts: Sequence[statements.Stmt]) -> None:
+        self.reset_budget()
+
         for stmt in stmts:
+            self.statement = stmt
             self.execute(stmt)
 
     @staticmethod
@@ -32,6 +109,9 @@ class Interpreter(expressions.ExprVisitor, statements.StmtVisitor):
         if isinstance(obj, str):
             return obj
 
+        if isinstance(obj, Rope):
+            return str(obj)
+
         if obj is None:
             return 'null'
 
@@ -52,6 +132,10 @@ class Interpreter(expressions.ExprVisitor, statements.StmtVisitor):
     def is_number(obj: Any) -> bool:
         return isinstance(obj, (int, float))
 
+    @staticmethod
+    def is_string(obj: Any) -> bool:
+        return isinstance(obj, (str, Rope))
+
     def check_number_operand(self, operator: Token, operand: Any) -> None:
         if self.is_number(operand):
             return
@@ -71,7 +155,7 @@ class Interpreter(expressions.ExprVisitor, statements.StmtVisitor):
 
     def visit_print_stmt(self, stmt: statements.Print) -> None:
         value = self.evaluate(stmt.expression)
-        print(self.stringify(value))
+        print(self.stringify(value), file=self.output)
 
         return None
 
@@ -104,10 +188,12 @@ class Interpreter(expressions.ExprVisitor, statements.StmtVisitor):
             self.check_number_operands(expr.operator, left, right)
             return left - right
         elif token_type == TokenType.PLUS:
-            if (self.is_number(left) and self.is_number(right)) \
-                    or (isinstance(left, str) and isinstance(right, str)):
+            if self.is_number(left) and self.is_number(right):
                 return left + right
 
+            if self.is_string(left) and self.is_string(right):
+                return concatenate(left, right)
+
             raise LoxRuntimeError(expr.operator,
                                   'Operands must be two strings or two numeric objects.')
         elif token_type == TokenType.SLASH:
@@ -154,5 +240,5 @@ class Interpreter(expressions.ExprVisitor, statements.StmtVisitor):
 
         return None
 
-    def visit_variable_expr(self, expr: expressions.Expr) -> Any:
-        pass
+    def visit_variable_expr(self, expr: expressions.Variable) -> Any:
+        return self.environment.get(expr.name)
@@ -1,10 +1,17 @@
+from io import TextIOWrapper
 from pathlib import Path
-from sys import version_info, platform
+from sys import stderr, stdin, stdout, version_info, platform
 
-from lox.interpreter import Interpreter, LoxRuntimeError
-from lox.parser import Parser, ParseError
+from lox.coverage import CoverageInterpreter, parse_with_coverage
+from lox.errors import LoxRuntimeError
+from lox.parser import ParseError, Parser
+from lox.records import BUFFER_SIZE, RecordError, RecordFilter, parse_expression
 from lox.scanner import Scanner
-from lox.tokens import Token, TokenType
+from lox.profiler import SamplingProfiler
+from lox.program import compile
+from lox.session import Session
+from lox.snapshot import Snapshot, SnapshotError, open_snapshot, save
+from lox.stats import PhaseStats, count_nodes
 
 
 def lox_copyright():
@@ -34,9 +41,7 @@ COMMANDS = {
 
 
 class Lox:
-    interpreter = Interpreter()
-    had_error = False
-    had_runtime_error = False
+    session = Session()
 
     @staticmethod
     def repl_intro() -> None:
@@ -52,52 +57,191 @@ class Lox:
 
     @staticmethod
     def usage(code: int) -> None:
-        print('Usage: lox [file]')
+        print('Usage: lox [[--tune-gc] file]\n'
+              '       lox (--stats | --stats-json) file\n'
+              '       lox --coverage report file\n'
+              '       lox --profile stacks file\n'
+              '       lox --snapshot snapshot file\n'
+              '       lox --restore snapshot [file]\n'
+              '       lox (--filter | --map) expression [--format jsonl|csv] [file]')
         exit(code)
 
     @staticmethod
-    def report(line: int, where: str, message: str) -> None:
-        print(f'[line {line}] Error{where}: {message}')
-
-        Lox.had_error = True
+    def run(source: str, tune_gc: bool = False) -> None:
+        Lox.session.run(source, tune_gc)
 
     @staticmethod
-    def error(token: Token, message: str) -> None:
-        if token.type == TokenType.EOF:
-            Lox.report(token.line, ' at end', message)
-        else:
-            Lox.report(token.line, f" at '{token.lexeme}'", message)
+    def run_file(filename, tune_gc: bool = False) -> None:
+        path = Path(filename).absolute()
+        source = path.read_text(encoding='utf-8', errors='strict')
+        Lox.run(source, tune_gc)
+
+        if Lox.session.had_error:
+            exit(65)
+        elif Lox.session.had_runtime_error:
+            exit(70)
 
     @staticmethod
-    def runtime_error(error: LoxRuntimeError) -> None:
-        print(f'{error}\n[line {error.token.line}]')
+    def run_file_with_stats(filename, output_format: str = 'text') -> None:
+        stats = PhaseStats()
+        stats.start()
+
+        try:
+            with stats.phase('read'):
+                source = Path(filename).absolute().read_text(encoding='utf-8', errors='strict')
 
-        Lox.had_runtime_error = True
+            with stats.phase('scan'):
+                tokens = Scanner(source).scan_tokens()
+
+            stats.counts['tokens'] = len(tokens)
+
+            with stats.phase('parse'):
+                stmts = Parser(tokens).parse()
+
+            stats.counts['nodes'] = count_nodes(stmts)
+            del tokens
+
+            with stats.phase('interpret'):
+                Lox.session.interpreter.interpret(stmts)
+        except ParseError as pe:
+            Lox.session.error(pe.token, str(pe))
+        except LoxRuntimeError as lre:
+            Lox.session.runtime_error(lre)
+        finally:
+            stats.stop()
+            report = stats.format_json() if output_format == 'json' else stats.format_text()
+            print(report, file=stderr)
+
+        if Lox.session.had_error:
+            exit(65)
+        elif Lox.session.had_runtime_error:
+            exit(70)
 
     @staticmethod
-    def run(source: str) -> None:
+    def run_file_with_profile(filename, stacks_path) -> None:
+        path = Path(filename).absolute()
+        source = path.read_text(encoding='utf-8', errors='strict')
+        session = Lox.session
+
         try:
-            scanner = Scanner(source)
-            tokens = scanner.scan_tokens()
-            parser = Parser(tokens)
-            stmts = parser.parse()
+            program = compile(source, cache=False)
+        except ParseError as pe:
+            session.error(pe.token, str(pe))
+            exit(65)
+
+        profiler = SamplingProfiler(session.interpreter, name=path.name)
+
+        try:
+            with profiler:
+                session.interpreter.interpret(program.statements)
+        except LoxRuntimeError as lre:
+            session.runtime_error(lre)
+        finally:
+            with Path(stacks_path).open('w', encoding='utf-8') as stream:
+                profiler.write_collapsed(stream)
 
-            Lox.interpreter.interpret(stmts)
+        if session.had_runtime_error:
+            exit(70)
+
+    @staticmethod
+    def run_file_with_snapshot(filename, snapshot_path) -> None:
+        path = Path(filename).absolute()
+        source = path.read_text(encoding='utf-8', errors='strict')
+        session = Lox.session
+
+        try:
+            program = compile(source, cache=False)
+            session.interpreter.interpret(program.statements)
         except ParseError as pe:
-            Lox.error(pe.token, str(pe))
+            session.error(pe.token, str(pe))
+            exit(65)
         except LoxRuntimeError as lre:
-            Lox.runtime_error(lre)
+            session.runtime_error(lre)
+            exit(70)
+
+        save(Snapshot.capture(session.interpreter, program), snapshot_path)
 
     @staticmethod
-    def run_file(filename) -> None:
+    def restore(snapshot_path, filename=None) -> None:
+        session = Lox.session
+
+        try:
+            snapshot = open_snapshot(snapshot_path)
+        except (OSError, SnapshotError) as error:
+            print(f'Cannot restore {snapshot_path}: {error}', file=stderr)
+            exit(66 if isinstance(error, OSError) else 65)
+
+        session.interpreter = snapshot.restore(session.output)
+
+        try:
+            snapshot.resume(session.interpreter)
+        except LoxRuntimeError as lre:
+            session.runtime_error(lre)
+            exit(70)
+
+        if filename is not None:
+            Lox.run_file(filename)
+
+    @staticmethod
+    def run_file_with_coverage(filename, report) -> None:
         path = Path(filename).absolute()
         source = path.read_text(encoding='utf-8', errors='strict')
-        Lox.run(source)
 
-        if Lox.had_error:
+        try:
+            stmts, coverage = parse_with_coverage(source)
+        except ParseError as pe:
+            Lox.session.error(pe.token, str(pe))
+            exit(65)
+
+        session = Lox.session
+        interpreter = CoverageInterpreter(coverage, session.interpreter.environment, session.output)
+
+        try:
+            interpreter.interpret(stmts)
+        except LoxRuntimeError as lre:
+            session.runtime_error(lre)
+        finally:
+            with Path(report).open('w', encoding='utf-8') as stream:
+                coverage.write_lcov(stream, str(path))
+
+        if session.had_runtime_error:
+            exit(70)
+
+    @staticmethod
+    def run_records(expression: str, mode: str, fmt: str, filename=None) -> None:
+        diagnostics = Session(output=stderr)
+
+        try:
+            record_filter = RecordFilter(parse_expression(expression), mode)
+        except ParseError as pe:
+            diagnostics.error(pe.token, str(pe))
             exit(65)
-        elif Lox.had_runtime_error:
+        except SyntaxError as se:
+            print(f'Error: {se.msg}', file=stderr)
+            exit(65)
+
+        if filename is None:
+            source = TextIOWrapper(stdin.buffer, encoding='utf-8', newline='')
+        else:
+            source = Path(filename).absolute().open(encoding='utf-8', newline='', buffering=BUFFER_SIZE)
+
+        sink = TextIOWrapper(stdout.buffer, encoding='utf-8', newline='')
+
+        try:
+            with source:
+                record_filter.run(source, sink, fmt)
+                sink.flush()
+        except RecordError as error:
+            sink.flush()
+            print(error, file=stderr)
+            exit(65)
+        except LoxRuntimeError as lre:
+            sink.flush()
+            diagnostics.runtime_error(lre)
             exit(70)
+        except BrokenPipeError:
+            sink.detach()
+            exit(0)
 
     @staticmethod
     def prompt() -> None:
@@ -114,8 +258,7 @@ class Lox:
                     COMMANDS[first]()
                 else:
                     Lox.run(expr)
-                    Lox.had_error = False
-                    Lox.had_runtime_error = False
+                    Lox.session.reset_errors()
             except KeyboardInterrupt as ki:
                 print(f'\n{ki.__class__.__name__}')
             except EOFError:
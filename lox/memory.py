@@ -0,0 +1,74 @@
+import gc
+from contextlib import contextmanager
+from threading import Lock
+from typing import Iterator, Optional, Tuple
+
+GC_THRESHOLD: Tuple[int, int, int] = (50000, 50, 1000)
+
+
+class GcState:
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.tuned = 0
+        self.threshold: Optional[Tuple[int, int, int]] = None
+        self.was_frozen = False
+        self.paused = 0
+        self.was_enabled = False
+
+    def tune(self, threshold: Tuple[int, int, int]) -> None:
+        with self.lock:
+            if self.tuned == 0:
+                self.threshold = gc.get_threshold()
+                self.was_frozen = gc.get_freeze_count() > 0
+                gc.freeze()
+                gc.set_threshold(*threshold)
+
+            self.tuned += 1
+
+    def untune(self) -> None:
+        with self.lock:
+            self.tuned -= 1
+
+            if self.tuned == 0:
+                gc.set_threshold(*self.threshold)
+
+                if not self.was_frozen:
+                    gc.unfreeze()
+
+    def pause(self) -> None:
+        with self.lock:
+            if self.paused == 0:
+                self.was_enabled = gc.isenabled()
+                gc.disable()
+
+            self.paused += 1
+
+    def resume(self) -> None:
+        with self.lock:
+            self.paused -= 1
+
+            if self.paused == 0 and self.was_enabled:
+                gc.enable()
+
+
+_state = GcState()
+
+
+@contextmanager
+def tuned_gc(threshold: Tuple[int, int, int] = GC_THRESHOLD) -> Iterator[None]:
+    _state.tune(threshold)
+
+    try:
+        yield
+    finally:
+        _state.untune()
+
+
+@contextmanager
+def paused_gc() -> Iterator[None]:
+    _state.pause()
+
+    try:
+        yield
+    finally:
+        _state.resume()
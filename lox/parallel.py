@@ -0,0 +1,149 @@
+import re
+from concurrent.futures import ProcessPoolExecutor
+from os import cpu_count
+from typing import Any, List, Optional, Pattern, Tuple
+
+from lox import expressions, statements
+from lox.memory import paused_gc
+from lox.parser import ParseError, Parser
+from lox.scanner import Scanner
+from lox.source import SourceMap
+from lox.symbols import SymbolTable
+from lox.tokens import Token, TokenType
+
+BOUNDARIES: Pattern = re.compile(r'"[^"]*"?|\'[^\']*\'?|//[^\n]*|[();]')
+
+MIN_CHUNK_SIZE = 256 * 1024
+
+ChunkResult = Tuple[List[statements.Stmt], List[str], Optional[Tuple[Token, str]]]
+
+_source = ''
+
+
+def split_points(source: str, chunks: int) -> List[int]:
+    if chunks < 2:
+        return [0, len(source)]
+
+    target = len(source) // chunks
+    points = [0]
+    depth = 0
+
+    for match in BOUNDARIES.finditer(source):
+        text = match.group()
+
+        if text == '(':
+            depth += 1
+        elif text == ')':
+            depth -= 1
+        elif text == ';' and depth == 0 and match.end() - points[-1] >= target:
+            points.append(match.end())
+
+            if len(points) == chunks:
+                break
+
+    if points[-1] != len(source):
+        points.append(len(source))
+
+    return points
+
+
+def _initialize(source: str) -> None:
+    global _source
+    _source = source
+
+
+def _parse_chunk(bounds: Tuple[int, int]) -> ChunkResult:
+    start, stop = bounds
+    scanner = Scanner(_source, start=start, stop=stop)
+    tokens = scanner.scan_tokens()
+
+    for token in tokens:
+        token.source = None
+
+    try:
+        stmts = Parser(tokens).parse()
+    except ParseError as pe:
+        return [], scanner.symbols.names, (pe.token, str(pe))
+
+    return stmts, scanner.symbols.names, None
+
+
+class Relinker:
+    def __init__(self, source_map: SourceMap, symbols: SymbolTable) -> None:
+        self.source_map = source_map
+        self.symbols = symbols
+        self.ids: List[int] = []
+
+    def merge_symbols(self, names: List[str]) -> None:
+        self.ids = [self.symbols.symbol_id(name) for name in names]
+
+    def relink_token(self, token: Token) -> None:
+        token.source = self.source_map
+
+        if token.type == TokenType.IDENTIFIER:
+            token.lexeme = self.symbols.intern(token.lexeme)
+            token.literal = self.ids[token.literal]
+        elif token.type == TokenType.STRING:
+            token.literal = self.symbols.intern(token.literal)
+
+    def relink(self, stmts: List[statements.Stmt]) -> None:
+        pending: List[Any] = list(stmts)
+
+        while pending:
+            node = pending.pop()
+
+            if isinstance(node, statements.Stmt):
+                node.source_map = self.source_map
+            elif isinstance(node, expressions.Literal) and isinstance(node.value, str):
+                node.value = self.symbols.intern(node.value)
+
+            for child in vars(node).values():
+                if isinstance(child, Token):
+                    self.relink_token(child)
+                elif isinstance(child, (expressions.Expr, statements.Stmt)):
+                    pending.append(child)
+                elif isinstance(child, list):
+                    pending.extend(child)
+
+
+def parse_parallel(
+        source: str,
+        workers: Optional[int] = None,
+        min_chunk_size: int = MIN_CHUNK_SIZE
+) -> List[statements.Stmt]:
+    workers = workers or cpu_count() or 1
+    chunks = min(workers, len(source) // min_chunk_size)
+    points = split_points(source, chunks)
+
+    if len(points) <= 2:
+        return Parser(Scanner(source).scan_tokens()).parse()
+
+    bounds = list(zip(points, points[1:]))
+
+    with paused_gc():
+        with ProcessPoolExecutor(len(bounds), initializer=_initialize, initargs=(source,)) as pool:
+            futures = [pool.submit(_parse_chunk, chunk) for chunk in bounds]
+
+            for future in futures:
+                future.exception()
+
+        for future in futures:
+            if isinstance(future.exception(), SyntaxError):
+                raise future.exception()
+
+        relinker = Relinker(SourceMap(source), SymbolTable())
+        stmts: List[statements.Stmt] = []
+
+        for future in futures:
+            chunk_stmts, names, error = future.result()
+            relinker.merge_symbols(names)
+
+            if error is not None:
+                token, message = error
+                relinker.relink_token(token)
+                raise ParseError(token, message)
+
+            relinker.relink(chunk_stmts)
+            stmts.extend(chunk_stmts)
+
+    return stmts
@@ -1,8 +1,10 @@
-from typing import List, Optional
+from typing import Any, List, Optional, TypeVar
 
 from lox import expressions, statements
 from lox.tokens import Token, TokenType
 
+Node = TypeVar('Node', expressions.Expr, statements.Stmt)
+
 
 class ParseError(RuntimeError):
     def __init__(self, token: Token, message: str) -> None:
@@ -10,10 +12,59 @@ class ParseError(RuntimeError):
         self.token = token
 
 
+class NodeFactory:
+    @staticmethod
+    def span(node: Node, first: Token, last: Token) -> Node:
+        node.start = first.start
+        node.end = last.end
+
+        return node
+
+    def literal(self, value: Any, first: Token, last: Token) -> expressions.Expr:
+        return self.span(expressions.Literal(value), first, last)
+
+    def grouping(self, expression: expressions.Expr, first: Token, last: Token) -> expressions.Expr:
+        return self.span(expressions.Grouping(expression), first, last)
+
+    def variable(self, name: Token) -> expressions.Expr:
+        return self.span(expressions.Variable(name), name, name)
+
+    def unary(self, operator: Token, right: expressions.Expr, last: Token) -> expressions.Expr:
+        return self.span(expressions.Unary(operator, right), operator, last)
+
+    def binary(
+            self,
+            left: expressions.Expr,
+            operator: Token,
+            right: expressions.Expr,
+            first: Token,
+            last: Token
+    ) -> expressions.Expr:
+        return self.span(expressions.Binary(left, operator, right), first, last)
+
+    def print_stmt(self, expression: expressions.Expr, first: Token, last: Token) -> statements.Stmt:
+        stmt = self.span(statements.Print(expression), first, last)
+        stmt.source_map = first.source
+
+        return stmt
+
+    def expression_stmt(
+            self,
+            expression: expressions.Expr,
+            first: Token,
+            last: Token
+    ) -> statements.Stmt:
+        stmt = self.span(statements.Expression(expression), first, last)
+        stmt.source_map = first.source
+
+        return stmt
+
+
 class Parser:
-    def __init__(self, tokens: List[Token]) -> None:
+    def __init__(self, tokens: List[Token], factory: Optional[NodeFactory] = None) -> None:
         self.tokens = tokens
         self.current = 0
+        self.factory = NodeFactory() if factory is None else factory
 
     def is_at_end(self) -> bool:
         return self.peek().type == TokenType.EOF
@@ -70,31 +121,35 @@ class Parser:
         return self.expression_statement()
 
     def print_statement(self) -> statements.Stmt:
+        start = self.previous()
         value = self.expression()
         self.consume(TokenType.SEMICOLON, "Expect ';' after value.")
 
-        return statements.Print(value)
+        return self.factory.print_stmt(value, start, self.previous())
 
     def expression_statement(self) -> statements.Stmt:
+        start = self.peek()
         expr = self.expression()
         self.consume(TokenType.SEMICOLON, "Expect ';' after expression.")
 
-        return statements.Expression(expr)
+        return self.factory.expression_stmt(expr, start, self.previous())
 
     def assignment(self) -> expressions.Expr:
         pass
 
     def equality(self) -> expressions.Expr:
+        start = self.peek()
         expr = self.comparison()
 
         while self.match(TokenType.BANG_EQUAL, TokenType.EQUAL_EQUAL):
             operator = self.previous()
             right = self.comparison()
-            expr = expressions.Binary(expr, operator, right)
+            expr = self.factory.binary(expr, operator, right, start, self.previous())
 
         return expr
 
     def comparison(self) -> expressions.Expr:
+        start = self.peek()
         expr = self.addition()
 
         while self.match(
@@ -105,29 +160,34 @@ class Parser:
         ):
             operator = self.previous()
             right = self.comparison()
-            expr = expressions.Binary(expr, operator, right)
+            expr = self.factory.binary(expr, operator, right, start, self.previous())
 
         return expr
 
     def primary(self) -> expressions.Expr:
+        start = self.peek()
+
         if self.match(TokenType.FALSE):
-            return expressions.Literal(False)
+            return self.factory.literal(False, start, start)
         elif self.match(TokenType.TRUE):
-            return expressions.Literal(True)
+            return self.factory.literal(True, start, start)
         elif self.match(TokenType.NULL):
-            return expressions.Literal(None)
+            return self.factory.literal(None, start, start)
 
         if self.match(
                 TokenType.INTEGER,
                 TokenType.FLOAT,
                 TokenType.STRING
         ):
-            return expressions.Literal(self.previous().literal)
+            return self.factory.literal(start.literal, start, start)
+
+        if self.match(TokenType.IDENTIFIER):
+            return self.factory.variable(start)
 
         if self.match(TokenType.LEFT_PAREN):
             expr = self.expression()
             self.consume(TokenType.RIGHT_PAREN, "Expect ')' after expression.")
-            return expressions.Grouping(expr)
+            return self.factory.grouping(expr, start, self.previous())
 
         raise self.error(self.peek(), 'Expect expression.')
 
@@ -136,7 +196,7 @@ class Parser:
             operator = self.previous()
             right = self.unary()
 
-            return expressions.Unary(operator, right)
+            return self.factory.unary(operator, right, self.previous())
 
         return self.primary()
 
@@ -144,22 +204,24 @@ class Parser:
         pass
 
     def addition(self) -> expressions.Expr:
+        start = self.peek()
         expr = self.multiplication()
 
         while self.match(TokenType.MINUS, TokenType.PLUS):
             operator = self.previous()
             right = self.multiplication()
-            expr = expressions.Binary(expr, operator, right)
+            expr = self.factory.binary(expr, operator, right, start, self.previous())
 
         return expr
 
     def multiplication(self) -> expressions.Expr:
+        start = self.peek()
         expr = self.unary()
 
         while self.match(TokenType.SLASH, TokenType.STAR):
             operator = self.previous()
             right = self.unary()
-            expr = expressions.Binary(expr, operator, right)
+            expr = self.factory.binary(expr, operator, right, start, self.previous())
 
         return expr
 
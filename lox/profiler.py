@@ -0,0 +1,134 @@
+import signal
+import sys
+from collections import Counter
+from threading import Event, Thread, get_ident, main_thread
+from types import FrameType
+from typing import Counter as CounterType, List, Optional, TextIO, Tuple, Union
+
+from lox import expressions, statements
+from lox.interpreter import Interpreter
+
+DEFAULT_INTERVAL = 0.005
+
+Node = Union[expressions.Expr, statements.Stmt]
+
+Stack = Tuple[str, ...]
+
+
+class SamplingProfiler:
+    def __init__(
+            self,
+            interpreter: Interpreter,
+            interval: float = DEFAULT_INTERVAL,
+            name: str = '<script>'
+    ) -> None:
+        self.interpreter = interpreter
+        self.interval = interval
+        self.name = name
+        self.samples: CounterType[Tuple[Node, ...]] = Counter()
+        self.thread_id: Optional[int] = None
+        self.stopped = Event()
+        self.sampler: Optional[Thread] = None
+        self.previous_handler = None
+        self.uses_signal = False
+
+    def __enter__(self) -> 'SamplingProfiler':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        self.thread_id = get_ident()
+        self.uses_signal = hasattr(signal, 'setitimer') and self.thread_id == main_thread().ident
+
+        if self.uses_signal:
+            self.previous_handler = signal.signal(signal.SIGPROF, self.handle_signal)
+            signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        else:
+            self.stopped.clear()
+            self.sampler = Thread(target=self.run, name='lox-profiler', daemon=True)
+            self.sampler.start()
+
+    def stop(self) -> None:
+        if self.uses_signal:
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            signal.signal(signal.SIGPROF, self.previous_handler)
+            self.uses_signal = False
+            return
+
+        self.stopped.set()
+
+        if self.sampler is not None:
+            self.sampler.join()
+            self.sampler = None
+
+    def handle_signal(self, signum: int, frame: Optional[FrameType]) -> None:
+        try:
+            self.sample(frame)
+        except RecursionError:
+            pass
+
+    def run(self) -> None:
+        while not self.stopped.wait(self.interval):
+            self.sample(sys._current_frames().get(self.thread_id))
+
+    def sample(self, frame: Optional[FrameType]) -> None:
+        interpreter = self.interpreter
+        stmt = interpreter.statement
+
+        if stmt is None:
+            return
+
+        nodes: List[Node] = [stmt]
+
+        while frame is not None:
+            if frame.f_code.co_name.endswith('_expr'):
+                local = frame.f_locals
+
+                if local.get('self') is interpreter:
+                    nodes.append(local.get('expr'))
+
+            frame = frame.f_back
+
+        self.samples[tuple(nodes)] += 1
+
+    def location(self, node: expressions.Expr, stmt: statements.Stmt) -> str:
+        if stmt.source_map is None:
+            return f'{node.start}'
+
+        line, column = stmt.source_map.location(node.start)
+        return f'{line}:{column}'
+
+    def label(self, expr: expressions.Expr, stmt: statements.Stmt) -> str:
+        kind = type(expr).__name__
+
+        if isinstance(expr, (expressions.Binary, expressions.Unary)):
+            kind = f'{kind} {expr.operator.lexeme}'
+        elif isinstance(expr, expressions.Variable):
+            kind = f'{kind} {expr.name.lexeme}'
+
+        return f'{kind} ({self.location(expr, stmt)})'
+
+    def stack(self, nodes: Tuple[Node, ...]) -> Stack:
+        stmt = nodes[0]
+        line = stmt.source_map.line(stmt.start) if stmt.source_map else 1
+        labels = [f'{self.name}:{line}']
+        labels.extend(self.label(expr, stmt)
+                      for expr in reversed(nodes[1:])
+                      if isinstance(expr, expressions.Expr))
+
+        return tuple(labels)
+
+    def stacks(self) -> CounterType[Stack]:
+        stacks: CounterType[Stack] = Counter()
+
+        for nodes, count in self.samples.items():
+            stacks[self.stack(nodes)] += count
+
+        return stacks
+
+    def write_collapsed(self, stream: TextIO) -> None:
+        for stack, count in sorted(self.stacks().items()):
+            stream.write(f'{";".join(stack)} {count}\n')
@@ -0,0 +1,82 @@
+from asyncio import StreamWriter
+from functools import lru_cache
+from typing import Any, Dict, NamedTuple, Optional, TextIO, Tuple
+
+from lox import statements
+from lox.aio import AsyncInterpreter
+from lox.environment import Environment
+from lox.errors import LoxRuntimeError
+from lox.interpreter import Interpreter
+from lox.memory import tuned_gc
+from lox.parser import Parser
+from lox.scanner import Scanner
+
+CACHE_SIZE = 1024
+
+
+class Program(NamedTuple):
+    source: str
+    statements: Tuple[statements.Stmt, ...]
+
+    def run(
+            self,
+            output: Optional[TextIO] = None,
+            env: Optional[Dict[str, Any]] = None,
+            max_steps: Optional[int] = None,
+            timeout: Optional[float] = None,
+            tune_gc: bool = False
+    ) -> Optional[LoxRuntimeError]:
+        environment = Environment(dict(env) if env else None)
+        interpreter = Interpreter(environment, output, max_steps, timeout)
+
+        try:
+            if tune_gc:
+                with tuned_gc():
+                    interpreter.interpret(self.statements)
+            else:
+                interpreter.interpret(self.statements)
+        except LoxRuntimeError as lre:
+            return lre
+
+        return None
+
+    async def run_async(
+            self,
+            stream: Optional[StreamWriter] = None,
+            env: Optional[Dict[str, Any]] = None,
+            max_steps: Optional[int] = None,
+            timeout: Optional[float] = None,
+            yield_interval: int = 64
+    ) -> Optional[LoxRuntimeError]:
+        environment = Environment(dict(env) if env else None)
+        interpreter = AsyncInterpreter(environment, stream, max_steps, timeout, yield_interval)
+
+        try:
+            await interpreter.interpret_async(self.statements)
+        except LoxRuntimeError as lre:
+            return lre
+
+        return None
+
+
+def parse(source: str) -> Program:
+    tokens = Scanner(source).scan_tokens()
+    stmts = Parser(tokens).parse()
+
+    return Program(source, tuple(stmts))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _compile_cached(source: str) -> Program:
+    return parse(source)
+
+
+def compile(source: str, cache: bool = True) -> Program:
+    if cache:
+        return _compile_cached(source)
+
+    return parse(source)
+
+
+def clear_cache() -> None:
+    _compile_cached.cache_clear()
@@ -0,0 +1,166 @@
+import csv
+import json
+import re
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Pattern, TextIO
+
+from lox import expressions
+from lox.environment import Environment
+from lox.errors import LoxRuntimeError
+from lox.interpreter import Interpreter
+from lox.parser import Parser
+from lox.scanner import Scanner
+
+FORMATS = ('jsonl', 'csv')
+
+MODES = ('filter', 'map')
+
+BATCH_SIZE = 4096
+
+BUFFER_SIZE = 1024 * 1024
+
+NUMBER: Pattern = re.compile(r'[+-]?[0-9]+(\.[0-9]+)?')
+
+Record = Dict[str, Any]
+
+
+class RecordError(ValueError):
+    pass
+
+
+def parse_expression(source: str) -> expressions.Expr:
+    parser = Parser(Scanner(source).scan_tokens())
+    expr = parser.expression()
+
+    if not parser.is_at_end():
+        raise parser.error(parser.peek(), 'Expect end of expression.')
+
+    return expr
+
+
+def coerce(field: str) -> Any:
+    match = NUMBER.fullmatch(field)
+
+    if match is None:
+        return field
+
+    return float(field) if match.group(1) else int(field)
+
+
+class RecordFilter:
+    def __init__(self, expr: expressions.Expr, mode: str = 'filter', batch_size: int = BATCH_SIZE) -> None:
+        if mode not in MODES:
+            raise ValueError(f'unknown mode {mode!r}, expected one of {", ".join(MODES)}')
+
+        self.expr = expr
+        self.mode = mode
+        self.batch_size = batch_size
+        self.interpreter = Interpreter(Environment())
+        self.records = 0
+
+    def evaluate_batch(self, records: List[Record], values: Optional[List[Any]] = None) -> List[Any]:
+        environment = self.interpreter.environment
+        evaluate = self.interpreter.evaluate
+        expr = self.expr
+        values = [] if values is None else values
+
+        try:
+            for record in records:
+                environment.values = record
+                values.append(evaluate(expr))
+        except LoxRuntimeError as lre:
+            number = self.records + len(values) + 1
+            raise LoxRuntimeError(lre.token, f'{lre} (record {number})') from lre
+
+        self.records += len(records)
+
+        return values
+
+    def batches(self, lines: Iterator[Any]) -> Iterator[List[Any]]:
+        while True:
+            batch = list(islice(lines, self.batch_size))
+
+            if not batch:
+                return
+
+            yield batch
+
+    def output(self, raw: List[str], values: List[Any]) -> List[str]:
+        if self.mode == 'map':
+            return [f'{Interpreter.stringify(value)}\n' for value in values]
+
+        is_truthy = self.interpreter.is_truthy
+        return [line for line, value in zip(raw, values) if is_truthy(value)]
+
+    def decode(self, line: str, number: int) -> Record:
+        try:
+            record = json.loads(line)
+        except ValueError as error:
+            raise RecordError(f'Invalid JSON: {error} (record {number})') from None
+
+        if not isinstance(record, dict):
+            raise RecordError(f'Expect a JSON object, got {type(record).__name__} (record {number})')
+
+        return record
+
+    def run_jsonl(self, source: TextIO, sink: TextIO) -> None:
+        for batch in self.batches(line for line in source if not line.isspace()):
+            first = self.records + 1
+            records: List[Record] = []
+            values: List[Any] = []
+
+            try:
+                try:
+                    for index, line in enumerate(batch):
+                        records.append(self.decode(line, first + index))
+                finally:
+                    self.evaluate_batch(records, values)
+            finally:
+                lines = [line if line.endswith('\n') else f'{line}\n' for line in batch[:len(values)]]
+                sink.write(''.join(self.output(lines, values)))
+
+    def run_csv(self, source: TextIO, sink: TextIO) -> None:
+        reader = csv.reader(source)
+        header = next(reader, None)
+
+        if header is None:
+            return
+
+        writer = csv.writer(sink, lineterminator='\n')
+
+        if self.mode == 'filter':
+            writer.writerow(header)
+
+        for batch in self.batches(reader):
+            values: List[Any] = []
+
+            try:
+                self.evaluate_batch([dict(zip(header, map(coerce, row))) for row in batch], values)
+            finally:
+                if self.mode == 'map':
+                    sink.write(''.join(self.output([], values)))
+                else:
+                    is_truthy = self.interpreter.is_truthy
+                    writer.writerows(row for row, value in zip(batch, values) if is_truthy(value))
+
+    def run(self, source: TextIO, sink: TextIO, fmt: str = 'jsonl') -> int:
+        if fmt == 'jsonl':
+            self.run_jsonl(source, sink)
+        elif fmt == 'csv':
+            self.run_csv(source, sink)
+        else:
+            raise ValueError(f'unknown format {fmt!r}, expected one of {", ".join(FORMATS)}')
+
+        return self.records
+
+
+def filter_records(
+        expression: str,
+        records: TextIO,
+        sink: TextIO,
+        fmt: str = 'jsonl',
+        mode: str = 'filter',
+        batch_size: Optional[int] = None
+) -> int:
+    record_filter = RecordFilter(parse_expression(expression), mode, batch_size or BATCH_SIZE)
+    return record_filter.run(records, sink, fmt)
@@ -0,0 +1,60 @@
+from typing import Any, List, Optional, Union
+
+FLAT_LIMIT = 256
+
+
+class Rope:
+    __slots__ = ('left', 'right', 'length', 'flat')
+
+    def __init__(self, left: Union[str, 'Rope'], right: Union[str, 'Rope']) -> None:
+        self.left: Optional[Union[str, Rope]] = left
+        self.right: Optional[Union[str, Rope]] = right
+        self.length = len(left) + len(right)
+        self.flat: Optional[str] = None
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __str__(self) -> str:
+        if self.flat is None:
+            self.flat = self.flatten()
+            self.left = None
+            self.right = None
+
+        return self.flat
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (str, Rope)):
+            return len(self) == len(other) and str(self) == str(other)
+
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({str(self)!r})'
+
+    def flatten(self) -> str:
+        parts: List[str] = []
+        pending: List[Union[str, Rope]] = [self]
+
+        while pending:
+            node = pending.pop()
+
+            if isinstance(node, str):
+                parts.append(node)
+            elif node.flat is not None:
+                parts.append(node.flat)
+            else:
+                pending.append(node.right)
+                pending.append(node.left)
+
+        return ''.join(parts)
+
+
+def concatenate(left: Union[str, Rope], right: Union[str, Rope]) -> Union[str, Rope]:
+    if len(left) + len(right) <= FLAT_LIMIT:
+        return str(left) + str(right)
+
+    return Rope(left, right)
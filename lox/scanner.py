@@ -1,5 +1,7 @@
 from typing import List, Union, Any, Optional
 
+from lox.source import SourceMap
+from lox.symbols import SymbolTable
 from lox.tokens import (
     TokenType,
     Token,
@@ -12,27 +14,32 @@ from lox.tokens import (
 
 
 class Scanner:
-    def __init__(self, source: str) -> None:
+    def __init__(
+            self,
+            source: str,
+            symbols: Optional[SymbolTable] = None,
+            start: int = 0,
+            stop: Optional[int] = None
+    ) -> None:
         self.source = source
+        self.symbols = SymbolTable() if symbols is None else symbols
         self.tokens: List[Token] = []
-        self.start = 0
-        self.current = 0
-        self.line = 1
+        self.first = start
+        self.stop = len(source) if stop is None else stop
+        self.start = start
+        self.current = start
+        self.source_map = SourceMap(source)
 
     @property
     def current_token(self) -> str:
         return self.source[self.start:self.current]
 
     def is_at_end(self) -> bool:
-        return self.current >= len(self.source)
+        return self.current >= self.stop
 
     def reset(self) -> None:
-        self.start = 0
-        self.current = 0
-        self.line = 1
-
-    def advance_line(self) -> None:
-        self.line += 1
+        self.start = self.first
+        self.current = self.first
 
     def advance(self) -> str:
         self.current += 1
@@ -45,7 +52,7 @@ class Scanner:
         return self.source[self.current]
 
     def peek_next(self) -> str:
-        if (self.current + 1) > len(self.source):
+        if (self.current + 1) >= self.stop:
             return '\0'
 
         return self.source[self.current + 1]
@@ -61,9 +68,14 @@ class Scanner:
         while self.peek().isalnum():
             self.advance()
 
-        text: str = self.current_token
+        ident: int = self.symbols.symbol_id(self.current_token)
+        text: str = self.symbols.names[ident]
         typ: TokenType = KEYWORDS.get(text, TokenType.IDENTIFIER)
-        self.add_token(typ)
+
+        if typ == TokenType.IDENTIFIER:
+            self.add_token(typ, ident, text)
+        else:
+            self.add_token(typ, lexeme=text)
 
     def number(self) -> None:
         def consume_digits():
@@ -87,21 +99,27 @@ class Scanner:
         self.add_token(typ, value)
 
     def string(self, starter: str) -> None:
-        while self.peek() != starter and not self.is_at_end():
-            if self.peek() == '\n':
-                self.advance_line()
-            self.advance()
+        end = self.source.find(starter, self.current, self.stop)
+        self.current = self.stop if end == -1 else end
 
         self.advance()
-        text: str = self.source[(self.start + 1):(self.current - 1)]
+        text: str = self.symbols.intern(self.source[(self.start + 1):(self.current - 1)])
         self.add_token(TokenType.STRING, text)
 
     def comment(self):
-        while self.peek() != '\n' and not self.is_at_end():
-            self.advance()
-
-    def add_token(self, typ: TokenType, literal: Optional[Any] = None) -> None:
-        token = Token(typ, self.current_token, literal, self.line)
+        end = self.source.find('\n', self.current, self.stop)
+        self.current = self.stop if end == -1 else end
+
+    def add_token(
+            self,
+            typ: TokenType,
+            literal: Optional[Any] = None,
+            lexeme: Optional[str] = None
+    ) -> None:
+        if lexeme is None:
+            lexeme = self.current_token
+
+        token = Token(typ, lexeme, literal, self.start, self.current, self.source_map)
         self.tokens.append(token)
 
     def scan_token(self) -> None:
@@ -125,7 +143,7 @@ class Scanner:
         elif char in WHITESPACE:
             return
         elif char == '\n':
-            self.advance_line()
+            return
         elif char == '/':
             if self.match('/'):
                 self.comment()
@@ -139,12 +157,14 @@ class Scanner:
             self.identifier()
         else:
             raise SyntaxError(f'Unexpected character "{char}" at '
-                              f'line {self.line}')
+                              f'line {self.source_map.line(self.start)}')
 
     def scan_tokens(self) -> List[Token]:
         while not self.is_at_end():
             self.start = self.current
             self.scan_token()
 
-        self.tokens.append(Token(TokenType.EOF, TokenType.EOF.value, None, self.line))
+        end = self.stop
+        self.tokens.append(Token(TokenType.EOF, TokenType.EOF.value, None, end, end,
+                                 self.source_map))
         return self.tokens
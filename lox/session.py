@@ -0,0 +1,58 @@
+from typing import Any, Dict, Optional, TextIO
+
+from lox.environment import Environment
+from lox.errors import LoxRuntimeError
+from lox.interpreter import Interpreter
+from lox.memory import tuned_gc
+from lox.parser import ParseError
+from lox.program import compile
+from lox.tokens import Token, TokenType
+
+
+class Session:
+    def __init__(
+            self,
+            output: Optional[TextIO] = None,
+            env: Optional[Dict[str, Any]] = None,
+            max_steps: Optional[int] = None,
+            timeout: Optional[float] = None
+    ) -> None:
+        self.output = output
+        self.interpreter = Interpreter(Environment(env), output, max_steps, timeout)
+        self.had_error = False
+        self.had_runtime_error = False
+
+    def reset_errors(self) -> None:
+        self.had_error = False
+        self.had_runtime_error = False
+
+    def report(self, line: int, column: int, where: str, message: str) -> None:
+        print(f'[line {line}:{column}] Error{where}: {message}', file=self.output)
+
+        self.had_error = True
+
+    def error(self, token: Token, message: str) -> None:
+        if token.type == TokenType.EOF:
+            self.report(token.line, token.column, ' at end', message)
+        else:
+            self.report(token.line, token.column, f" at '{token.lexeme}'", message)
+
+    def runtime_error(self, error: LoxRuntimeError) -> None:
+        token = error.token
+        print(f'{error}\n[line {token.line}:{token.column}]', file=self.output)
+
+        self.had_runtime_error = True
+
+    def run(self, source: str, tune_gc: bool = False) -> None:
+        try:
+            program = compile(source)
+
+            if tune_gc:
+                with tuned_gc():
+                    self.interpreter.interpret(program.statements)
+            else:
+                self.interpreter.interpret(program.statements)
+        except ParseError as pe:
+            self.error(pe.token, str(pe))
+        except LoxRuntimeError as lre:
+            self.runtime_error(lre)
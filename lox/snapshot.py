@@ -0,0 +1,115 @@
+import pickle
+import zlib
+from io import BytesIO
+from pathlib import Path
+from typing import Any, BinaryIO, FrozenSet, NamedTuple, Optional, Set, TextIO, Tuple, Union
+
+from lox import expressions, statements
+from lox.environment import Environment
+from lox.interpreter import Interpreter
+from lox.memory import paused_gc
+from lox.program import Program
+from lox.rope import Rope
+from lox.source import SourceMap
+from lox.tokens import Token, TokenType
+
+MAGIC = b'LOXSNAP'
+
+VERSION = 1
+
+COMPRESSION_LEVEL = 1
+
+
+class SnapshotError(ValueError):
+    pass
+
+
+def node_classes(module: Any, base: type) -> Set[Tuple[str, str]]:
+    return {(module.__name__, name)
+            for name, value in vars(module).items()
+            if isinstance(value, type) and issubclass(value, base) and value is not base}
+
+
+ALLOWED_CLASSES: FrozenSet[Tuple[str, str]] = frozenset(
+    {(cls.__module__, cls.__name__) for cls in (Program, Environment, Token, TokenType, SourceMap)}
+    | node_classes(expressions, expressions.Expr)
+    | node_classes(statements, statements.Stmt)
+)
+
+
+class SnapshotUnpickler(pickle.Unpickler):
+    def find_class(self, module: str, name: str) -> Any:
+        if '.' not in name and (module, name) in ALLOWED_CLASSES:
+            return super().find_class(module, name)
+
+        raise SnapshotError(f'snapshot refers to {module}.{name}, which is not a lox AST or state class')
+
+
+class Snapshot(NamedTuple):
+    program: Program
+    environment: Environment
+    position: int
+
+    @classmethod
+    def capture(
+            cls,
+            interpreter: Interpreter,
+            program: Program,
+            position: Optional[int] = None
+    ) -> 'Snapshot':
+        values = {name: str(value) if isinstance(value, Rope) else value
+                  for name, value in interpreter.environment.values.items()}
+        position = len(program.statements) if position is None else position
+
+        return cls(program, Environment(values), position)
+
+    def restore(
+            self,
+            output: Optional[TextIO] = None,
+            max_steps: Optional[int] = None,
+            timeout: Optional[float] = None
+    ) -> Interpreter:
+        environment = Environment(dict(self.environment.values))
+        return Interpreter(environment, output, max_steps, timeout)
+
+    def resume(self, interpreter: Interpreter) -> None:
+        interpreter.interpret(self.program.statements[self.position:])
+
+
+def dump(snapshot: Snapshot, stream: BinaryIO) -> None:
+    with paused_gc():
+        payload = pickle.dumps(tuple(snapshot), protocol=pickle.HIGHEST_PROTOCOL)
+
+    stream.write(MAGIC)
+    stream.write(bytes([VERSION]))
+    stream.write(zlib.compress(payload, COMPRESSION_LEVEL))
+
+
+def load(stream: BinaryIO) -> Snapshot:
+    header = stream.read(len(MAGIC) + 1)
+
+    if header[:len(MAGIC)] != MAGIC:
+        raise SnapshotError('not a lox snapshot')
+
+    if header[len(MAGIC):] != bytes([VERSION]):
+        raise SnapshotError(f'unsupported snapshot version {header[len(MAGIC):].hex()}')
+
+    try:
+        payload = zlib.decompress(stream.read())
+    except zlib.error as error:
+        raise SnapshotError(f'corrupt snapshot: {error}') from None
+
+    with paused_gc():
+        program, environment, position = SnapshotUnpickler(BytesIO(payload)).load()
+
+    return Snapshot(program, environment, position)
+
+
+def save(snapshot: Snapshot, path: Union[str, Path]) -> None:
+    with Path(path).open('wb') as stream:
+        dump(snapshot, stream)
+
+
+def open_snapshot(path: Union[str, Path]) -> Snapshot:
+    with Path(path).open('rb') as stream:
+        return load(stream)
@@ -0,0 +1,40 @@
+from bisect import bisect_left
+from typing import List, Optional, Tuple
+
+
+class SourceMap:
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self._newlines: Optional[List[int]] = None
+
+    @property
+    def newlines(self) -> List[int]:
+        if self._newlines is None:
+            self._newlines = self.index_newlines(self.text)
+
+        return self._newlines
+
+    @staticmethod
+    def index_newlines(text: str) -> List[int]:
+        offsets: List[int] = []
+        find = text.find
+        position = find('\n')
+
+        while position != -1:
+            offsets.append(position)
+            position = find('\n', position + 1)
+
+        return offsets
+
+    def line(self, offset: int) -> int:
+        return bisect_left(self.newlines, offset) + 1
+
+    def column(self, offset: int) -> int:
+        return self.location(offset)[1]
+
+    def location(self, offset: int) -> Tuple[int, int]:
+        newlines = self.newlines
+        index = bisect_left(newlines, offset)
+        line_start = newlines[index - 1] + 1 if index else 0
+
+        return index + 1, offset - line_start + 1
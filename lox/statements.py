@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 
 from lox.expressions import Expr
+from lox.source import SourceMap
 
 
 class StmtVisitor(ABC):
@@ -14,6 +16,11 @@ class StmtVisitor(ABC):
 
 
 class Stmt(ABC):
+    start: int = 0
+    end: int = 0
+    source_map: Optional[SourceMap] = None
+    index: int = -1
+
     @abstractmethod
     def accept(self, visitor: StmtVisitor):
         pass
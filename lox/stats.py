@@ -0,0 +1,100 @@
+import json
+import tracemalloc
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Dict, Iterator, List, Sequence, Union
+
+from lox import expressions, statements
+
+Node = Union[expressions.Expr, statements.Stmt]
+
+
+def count_nodes(stmts: Sequence[statements.Stmt]) -> int:
+    pending: List[Node] = list(stmts)
+    count = 0
+
+    while pending:
+        node = pending.pop()
+        count += 1
+
+        for child in vars(node).values():
+            if isinstance(child, (expressions.Expr, statements.Stmt)):
+                pending.append(child)
+            elif isinstance(child, list):
+                pending.extend(item for item in child if isinstance(item, expressions.Expr))
+
+    return count
+
+
+class PhaseStats:
+    def __init__(self) -> None:
+        self.phases: Dict[str, Dict[str, float]] = {}
+        self.counts: Dict[str, Any] = {}
+        self.snapshots: Dict[str, tracemalloc.Snapshot] = {}
+
+    def start(self) -> None:
+        tracemalloc.start()
+        self.snapshots['start'] = tracemalloc.take_snapshot()
+
+    def stop(self) -> None:
+        tracemalloc.stop()
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        before, _ = tracemalloc.get_traced_memory()
+
+        if hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+
+        started = perf_counter()
+
+        try:
+            yield
+        finally:
+            elapsed = perf_counter() - started
+            current, peak = tracemalloc.get_traced_memory()
+            self.snapshots[name] = tracemalloc.take_snapshot()
+            self.phases[name] = {
+                'seconds': elapsed,
+                'peak_bytes': max(peak - before, 0),
+                'retained_bytes': current - before,
+            }
+
+    def retained_between(self, first: str, second: str) -> int:
+        differences = self.snapshots[second].compare_to(self.snapshots[first], 'filename')
+        return sum(difference.size_diff for difference in differences)
+
+    def report(self) -> Dict[str, Any]:
+        report: Dict[str, Any] = {'phases': self.phases}
+        report.update(self.counts)
+
+        if 'scan' in self.snapshots and 'parse' in self.snapshots and self.counts.get('nodes'):
+            ast_bytes = self.retained_between('scan', 'parse')
+            report['ast_bytes'] = ast_bytes
+            report['bytes_per_node'] = ast_bytes / self.counts['nodes']
+
+        if 'read' in self.snapshots and 'scan' in self.snapshots and self.counts.get('tokens'):
+            token_bytes = self.retained_between('read', 'scan')
+            report['token_bytes'] = token_bytes
+            report['bytes_per_token'] = token_bytes / self.counts['tokens']
+
+        return report
+
+    def format_json(self) -> str:
+        return json.dumps(self.report(), sort_keys=True)
+
+    def format_text(self) -> str:
+        report = self.report()
+        lines = [f'{"phase":<10} {"seconds":>10} {"peak KiB":>10} {"retained KiB":>13}']
+
+        for name, phase in report['phases'].items():
+            lines.append(f'{name:<10} {phase["seconds"]:>10.6f} '
+                         f'{phase["peak_bytes"] / 1024:>10.1f} '
+                         f'{phase["retained_bytes"] / 1024:>13.1f}')
+
+        for key in ('tokens', 'bytes_per_token', 'nodes', 'bytes_per_node'):
+            if key in report:
+                value = report[key]
+                lines.append(f'{key}: {value:.1f}' if isinstance(value, float) else f'{key}: {value}')
+
+        return '\n'.join(lines)
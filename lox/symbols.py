@@ -0,0 +1,29 @@
+from typing import Dict, List
+
+
+class SymbolTable:
+    def __init__(self) -> None:
+        self.ids: Dict[str, int] = {}
+        self.names: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.ids
+
+    def symbol_id(self, name: str) -> int:
+        ident = self.ids.get(name)
+
+        if ident is None:
+            ident = len(self.names)
+            self.ids[name] = ident
+            self.names.append(name)
+
+        return ident
+
+    def intern(self, name: str) -> str:
+        return self.names[self.symbol_id(name)]
+
+    def name(self, ident: int) -> str:
+        return self.names[ident]
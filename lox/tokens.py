@@ -1,5 +1,7 @@
 from enum import Enum
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Optional, Tuple
+
+from lox.source import SourceMap
 
 
 class TokenType(Enum):
@@ -134,21 +136,41 @@ STRING_STARTERS: Tuple[str] = ('"', "'")
 
 
 class Token:
+    __slots__ = ('type', 'lexeme', 'literal', 'start', 'end', 'source')
+
     def __init__(
             self,
             typ: TokenType,
             lexeme: str,
             literal: Any,
-            line: int
+            start: int = 0,
+            end: int = 0,
+            source: Optional[SourceMap] = None
     ) -> None:
         self.type = typ
         self.lexeme = lexeme
         self.literal = literal
-        self.line = line
+        self.start = start
+        self.end = end
+        self.source = source
+
+    @property
+    def line(self) -> int:
+        if self.source is None:
+            return 1
+
+        return self.source.line(self.start)
+
+    @property
+    def column(self) -> int:
+        if self.source is None:
+            return self.start + 1
+
+        return self.source.column(self.start)
 
     def __str__(self) -> str:
         return f'{self.type}: {self.lexeme}, {self.literal}, {self.line}'
 
     def __repr__(self) -> str:
-        properties = f'{self.type}, {self.lexeme}, {self.literal}, {self.line}'
+        properties = f'{self.type}, {self.lexeme}, {self.literal}, {self.start}, {self.end}'
         return f'{self.__class__.__name__}({properties})'
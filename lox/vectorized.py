@@ -0,0 +1,298 @@
+from typing import Any, Dict, Mapping, Tuple
+
+from lox import expressions
+from lox.environment import Environment
+from lox.errors import LoxRuntimeError
+from lox.interpreter import Interpreter
+from lox.tokens import TokenType
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+Column = Tuple[str, Any]
+
+NUMERIC_KINDS = ('int', 'float', 'bool')
+
+INT_LIMIT = 2 ** 31
+
+DTYPE_KINDS: Dict[str, str] = {
+    'b': 'bool',
+    'i': 'int',
+    'u': 'int',
+    'f': 'float',
+    'U': 'str',
+}
+
+
+class Unvectorizable(Exception):
+    pass
+
+
+class VectorizedEvaluator(expressions.ExprVisitor):
+    def __init__(self, columns: Mapping[str, Any]) -> None:
+        if numpy is None:
+            raise ImportError('numpy is required for vectorized evaluation')
+
+        self.columns = {name: self.as_column(values) for name, values in columns.items()}
+        self.size = self.column_size(self.columns)
+
+    @staticmethod
+    def as_column(values: Any) -> Any:
+        if isinstance(values, numpy.ndarray):
+            kind = values.dtype.kind
+
+            if kind == 'f':
+                return values.astype(numpy.float64)
+
+            if kind not in 'iu':
+                return values
+
+            limits = numpy.iinfo(numpy.int64)
+
+            if values.size and (values.max() > limits.max or values.min() < limits.min):
+                return values.astype(object)
+
+            return values.astype(numpy.int64)
+
+        values = list(values)
+        types = {type(value) for value in values}
+
+        try:
+            if types == {int}:
+                return numpy.asarray(values, dtype=numpy.int64)
+
+            if len(types) <= 1:
+                return numpy.asarray(values)
+        except OverflowError:
+            pass
+
+        column = numpy.empty(len(values), dtype=object)
+        column[:] = values
+
+        return column
+
+    @staticmethod
+    def column_size(columns: Mapping[str, Any]) -> int:
+        sizes = {values.shape for values in columns.values()}
+
+        if len(sizes) > 1 or any(len(shape) != 1 for shape in sizes):
+            raise ValueError('columns must be one-dimensional arrays of the same length')
+
+        return sizes.pop()[0] if sizes else 1
+
+    def evaluate(self, expr: expressions.Expr) -> Any:
+        if self.size == 0:
+            return numpy.empty(0)
+
+        try:
+            _, values = expr.accept(self)
+        except Unvectorizable:
+            return self.evaluate_rows(expr)
+
+        return numpy.broadcast_to(values, (self.size,))
+
+    def evaluate_rows(self, expr: expressions.Expr) -> Any:
+        names = list(self.columns)
+        rows = zip(*(self.columns[name].tolist() for name in names))
+        environment = Environment()
+        interpreter = Interpreter(environment)
+        results = []
+
+        for row in rows if names else [()] * self.size:
+            environment.values = dict(zip(names, row))
+            results.append(interpreter.evaluate(expr))
+
+        array = numpy.empty(len(results), dtype=object)
+        array[:] = results
+
+        return array
+
+    @staticmethod
+    def kind_of(value: Any) -> str:
+        if value is None:
+            return 'null'
+
+        if isinstance(value, (bool, int, float, str)):
+            return type(value).__name__
+
+        raise Unvectorizable
+
+    @staticmethod
+    def as_number(column: Column) -> Any:
+        kind, values = column
+
+        if kind == 'bool':
+            return numpy.asarray(values, dtype=numpy.int64)
+
+        return values
+
+    @staticmethod
+    def truthiness(column: Column) -> Any:
+        kind, values = column
+
+        if kind == 'null':
+            return numpy.asarray(False)
+        elif kind == 'bool':
+            return numpy.asarray(values)
+        elif kind == 'str':
+            return numpy.char.str_len(values) != 0
+
+        return values != 0
+
+    @staticmethod
+    def equality(left: Column, right: Column) -> Any:
+        left_kind, left_values = left
+        right_kind, right_values = right
+
+        if left_kind == 'null' or right_kind == 'null':
+            return numpy.asarray(left_kind == right_kind)
+
+        if (left_kind in NUMERIC_KINDS) != (right_kind in NUMERIC_KINDS):
+            return numpy.asarray(False)
+
+        return numpy.equal(left_values, right_values)
+
+    @staticmethod
+    def check_number_operands(operator, left: Column, right: Column) -> None:
+        if left[0] in NUMERIC_KINDS and right[0] in NUMERIC_KINDS:
+            return
+
+        raise LoxRuntimeError(operator, 'Operands must be numeric objects.')
+
+    @staticmethod
+    def arithmetic_kind(left: Column, right: Column) -> str:
+        if 'float' in (left[0], right[0]):
+            return 'float'
+
+        return 'int'
+
+    @staticmethod
+    def check_int_range(*columns: Column) -> None:
+        for kind, values in columns:
+            if kind == 'int' and numpy.any((values >= INT_LIMIT) | (values <= -INT_LIMIT)):
+                raise Unvectorizable
+
+    def integer_operands(self, left: Column, right: Column) -> str:
+        kind = self.arithmetic_kind(left, right)
+
+        if kind == 'int':
+            self.check_int_range(left, right)
+
+        return kind
+
+    def visit_assign_expr(self, expr: expressions.Expr) -> Column:
+        raise Unvectorizable
+
+    def visit_binary_expr(self, expr: expressions.Binary) -> Column:
+        left = expr.left.accept(self)
+        right = expr.right.accept(self)
+
+        token_type = expr.operator.type
+
+        if token_type == TokenType.BANG_EQUAL:
+            return 'bool', ~self.equality(left, right)
+        elif token_type == TokenType.EQUAL_EQUAL:
+            return 'bool', self.equality(left, right)
+        elif token_type == TokenType.GREATER:
+            self.check_number_operands(expr.operator, left, right)
+            return 'bool', numpy.greater(left[1], right[1])
+        elif token_type == TokenType.GREATER_EQUAL:
+            self.check_number_operands(expr.operator, left, right)
+            return 'bool', numpy.greater_equal(left[1], right[1])
+        elif token_type == TokenType.LESS:
+            self.check_number_operands(expr.operator, left, right)
+            return 'bool', numpy.less(left[1], right[1])
+        elif token_type == TokenType.LESS_EQUAL:
+            self.check_number_operands(expr.operator, left, right)
+            return 'bool', numpy.less_equal(left[1], right[1])
+        elif token_type == TokenType.MINUS:
+            self.check_number_operands(expr.operator, left, right)
+            kind = self.integer_operands(left, right)
+            return kind, numpy.subtract(self.as_number(left), self.as_number(right))
+        elif token_type == TokenType.PLUS:
+            if left[0] == 'str' and right[0] == 'str':
+                return 'str', numpy.char.add(left[1], right[1])
+
+            if left[0] in NUMERIC_KINDS and right[0] in NUMERIC_KINDS:
+                kind = self.integer_operands(left, right)
+                return kind, numpy.add(self.as_number(left), self.as_number(right))
+
+            raise LoxRuntimeError(expr.operator,
+                                  'Operands must be two strings or two numeric objects.')
+        elif token_type == TokenType.SLASH:
+            self.check_number_operands(expr.operator, left, right)
+
+            if not numpy.all(right[1]):
+                raise Unvectorizable
+
+            return 'float', numpy.true_divide(self.as_number(left), self.as_number(right))
+        elif token_type == TokenType.STAR:
+            self.check_number_operands(expr.operator, left, right)
+            kind = self.integer_operands(left, right)
+            return kind, numpy.multiply(self.as_number(left), self.as_number(right))
+
+        raise Unvectorizable
+
+    def visit_call_expr(self, expr: expressions.Expr) -> Column:
+        raise Unvectorizable
+
+    def visit_get_expr(self, expr: expressions.Expr) -> Column:
+        raise Unvectorizable
+
+    def visit_grouping_expr(self, expr: expressions.Grouping) -> Column:
+        return expr.expression.accept(self)
+
+    def visit_literal_expr(self, expr: expressions.Literal) -> Column:
+        kind = self.kind_of(expr.value)
+
+        if kind == 'null':
+            return kind, numpy.asarray(None, dtype=object)
+
+        return kind, numpy.asarray(expr.value)
+
+    def visit_logical_expr(self, expr: expressions.Expr) -> Column:
+        raise Unvectorizable
+
+    def visit_this_expr(self, expr: expressions.Expr) -> Column:
+        raise Unvectorizable
+
+    def visit_set_expr(self, expr: expressions.Expr) -> Column:
+        raise Unvectorizable
+
+    def visit_super_expr(self, expr: expressions.Expr) -> Column:
+        raise Unvectorizable
+
+    def visit_unary_expr(self, expr: expressions.Unary) -> Column:
+        right = expr.right.accept(self)
+
+        if expr.operator.type == TokenType.BANG:
+            return 'bool', ~self.truthiness(right)
+        elif expr.operator.type == TokenType.MINUS:
+            if right[0] not in NUMERIC_KINDS:
+                raise LoxRuntimeError(expr.operator, 'Operand must be a numeric object.')
+
+            kind = 'float' if right[0] == 'float' else 'int'
+            self.check_int_range(right)
+            return kind, numpy.negative(self.as_number(right))
+
+        raise Unvectorizable
+
+    def visit_variable_expr(self, expr: expressions.Variable) -> Column:
+        name = expr.name.lexeme
+
+        if name not in self.columns:
+            raise LoxRuntimeError(expr.name, f"Undefined variable '{name}'.")
+
+        values = self.columns[name]
+        kind = DTYPE_KINDS.get(values.dtype.kind)
+
+        if kind is None:
+            raise Unvectorizable
+
+        return kind, values
+
+
+def evaluate_columns(expr: expressions.Expr, columns: Mapping[str, Any]) -> Any:
+    return VectorizedEvaluator(columns).evaluate(expr)
@@ -0,0 +1,57 @@
+import pickle
+import unittest
+import zlib
+from io import BytesIO, StringIO
+
+from lox.environment import Environment
+from lox.interpreter import Interpreter
+from lox.program import compile
+from lox.snapshot import MAGIC, VERSION, Snapshot, SnapshotError, dump, load
+
+
+def snapshot_bytes(payload: bytes) -> BytesIO:
+    return BytesIO(MAGIC + bytes([VERSION]) + zlib.compress(payload))
+
+
+def global_payload(module: str, name: str) -> bytes:
+    def unicode(text: str) -> bytes:
+        data = text.encode('utf-8')
+        return pickle.SHORT_BINUNICODE + bytes([len(data)]) + data
+
+    return pickle.PROTO + b'\x04' + unicode(module) + unicode(name) + pickle.STACK_GLOBAL + pickle.STOP
+
+
+class SnapshotTest(unittest.TestCase):
+    def test_round_trip(self) -> None:
+        program = compile('print greeting + "!";', cache=False)
+        interpreter = Interpreter(Environment({'greeting': 'hi'}))
+        stream = BytesIO()
+        dump(Snapshot.capture(interpreter, program, 0), stream)
+        stream.seek(0)
+
+        snapshot = load(stream)
+        output = StringIO()
+        snapshot.resume(snapshot.restore(output))
+
+        self.assertEqual(output.getvalue(), 'hi!\n')
+
+    def test_rejects_dotted_names(self) -> None:
+        for module, name in (('lox.snapshot', 'pickle.loads'),
+                             ('lox.program', 'Program.__init__'),
+                             ('lox.snapshot', 'os.system')):
+            with self.subTest(module=module, name=name):
+                with self.assertRaises(SnapshotError):
+                    load(snapshot_bytes(global_payload(module, name)))
+
+    def test_rejects_non_lox_classes(self) -> None:
+        for module, name in (('lox.snapshot', 'pickle'),
+                             ('lox.snapshot', 'load'),
+                             ('os', 'system'),
+                             ('builtins', 'eval')):
+            with self.subTest(module=module, name=name):
+                with self.assertRaises(SnapshotError):
+                    load(snapshot_bytes(global_payload(module, name)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import gc
+from argparse import ArgumentParser
+from io import StringIO
+from threading import Event, Thread
+from time import perf_counter
+from typing import Any, Dict, List
+
+from lox.memory import tuned_gc
+from lox.program import compile
+
+arg_parser = ArgumentParser(usage='python -m tools.gc_bench [options]')
+arg_parser.add_argument('--statements', type=int, default=50000,
+                        help='Statements in the benchmark program. Default: 50000')
+arg_parser.add_argument('--repeat', type=int, default=3,
+                        help='Runs per mode; the best one is reported. Default: 3')
+arg_parser.add_argument('--host-batch', type=int, default=1000,
+                        help='Container objects a host thread allocates on each wake-up while the script runs. '
+                             'Default: 1000')
+
+CHUNK = 'x' * 300
+
+HOST_INTERVAL = 0.001
+
+
+class PauseRecorder:
+    def __init__(self) -> None:
+        self.pauses: List[float] = []
+        self.started = 0.0
+
+    def __call__(self, phase: str, info: Dict[str, int]) -> None:
+        if phase == 'start':
+            self.started = perf_counter()
+        else:
+            self.pauses.append(perf_counter() - self.started)
+
+
+class HostAllocator:
+    def __init__(self, batch: int) -> None:
+        self.batch = batch
+        self.retained: List[List[Any]] = []
+        self.stopped = Event()
+        self.thread = Thread(target=self.run, name='host-allocator', daemon=True)
+
+    def __enter__(self) -> 'HostAllocator':
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stopped.set()
+        self.thread.join()
+        self.retained.clear()
+
+    def run(self) -> None:
+        while not self.stopped.wait(HOST_INTERVAL):
+            self.retained.extend([index, str(index)] for index in range(self.batch))
+
+
+def workload(statements: int) -> str:
+    line = f'print ("{CHUNK}" + "{CHUNK}" + "{CHUNK}") == "{CHUNK}" + "{CHUNK}" != 1 + 2 * 3 > 4;\n'
+    return line * statements
+
+
+def timed_collection() -> float:
+    started = perf_counter()
+    gc.collect()
+    return perf_counter() - started
+
+
+def measure(source: str, tune_gc: bool, host_batch: int) -> Dict[str, float]:
+    program = compile(source, cache=False)
+    recorder = PauseRecorder()
+    gc.collect()
+    gc.callbacks.append(recorder)
+
+    try:
+        with HostAllocator(host_batch):
+            started = perf_counter()
+            error = program.run(output=StringIO(), tune_gc=tune_gc)
+            elapsed = perf_counter() - started
+    finally:
+        gc.callbacks.remove(recorder)
+
+    if error is not None:
+        raise error
+
+    if tune_gc:
+        with tuned_gc():
+            full_collection = timed_collection()
+    else:
+        full_collection = timed_collection()
+
+    return {
+        'seconds': elapsed,
+        'collections': len(recorder.pauses),
+        'gc_seconds': sum(recorder.pauses),
+        'max_pause_ms': max(recorder.pauses, default=0.0) * 1000,
+        'full_collection_ms': full_collection * 1000,
+        'statements_per_second': len(program.statements) / elapsed,
+    }
+
+
+def main() -> None:
+    args = arg_parser.parse_args()
+    source = workload(args.statements)
+
+    for tune_gc in (False, True):
+        runs = [measure(source, tune_gc, args.host_batch) for _ in range(args.repeat)]
+        best = min(runs, key=lambda run: run['seconds'])
+        label = 'tuned' if tune_gc else 'default'
+
+        print(f'{label:<8} {best["seconds"]:.3f} s, '
+              f'{best["statements_per_second"]:,.0f} statements/s, '
+              f'{best["collections"]} collections, '
+              f'{best["gc_seconds"] * 1000:.1f} ms in GC, '
+              f'max pause {best["max_pause_ms"]:.2f} ms, '
+              f'full collection {best["full_collection_ms"]:.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -14,12 +14,28 @@ ASTDict = Dict[str, Tuple[str]]
 DEFAULT_IMPORTS: Tuple[str] = ('from abc import ABC, abstractmethod',)
 
 EXPRESSIONS_IMPORTS: Tuple[str] = DEFAULT_IMPORTS + (
-    'from typing import Any, List',
-    'from lox.scanner import Scanner',
+    'from typing import Any, List, Optional',
+    '',
+    'from lox.source import SourceMap',
     'from lox.tokens import Token',
 )
 
-STATEMENTS_IMPORTS: Tuple[str] = DEFAULT_IMPORTS + ('from lox.expressions import Expr',)
+STATEMENTS_IMPORTS: Tuple[str] = DEFAULT_IMPORTS + (
+    'from typing import Optional',
+    '',
+    'from lox.expressions import Expr',
+    'from lox.source import SourceMap',
+)
+
+BASE_ATTRIBUTES: Tuple[str] = (
+    'start: int = 0',
+    'end: int = 0',
+    'source_map: Optional[SourceMap] = None',
+)
+
+EXPRESSIONS_ATTRIBUTES: Tuple[str] = BASE_ATTRIBUTES
+
+STATEMENTS_ATTRIBUTES: Tuple[str] = BASE_ATTRIBUTES + ('index: int = -1',)
 
 EXPRESSIONS: ASTDict = {
     'Assign': ('name: Token', 'value: Expr'),
@@ -44,7 +60,13 @@ STATEMENTS: ASTDict = {
 INDENTATION = '    '
 
 
-def define_ast(path: Path, base_name: str, types: ASTDict, imports: Tuple[str]) -> None:
+def define_ast(
+        path: Path,
+        base_name: str,
+        types: ASTDict,
+        imports: Tuple[str],
+        attributes: Tuple[str]
+) -> None:
     name = base_name.title()
     visitor = f'{base_name}Visitor'
 
@@ -54,6 +76,12 @@ def define_ast(path: Path, base_name: str, types: ASTDict, imports: Tuple[str])
         file.write('\n\n')
         file.write(f'class {name}(ABC):')
         file.write('\n')
+
+        for attribute in attributes:
+            file.write(f'{INDENTATION}{attribute}')
+            file.write('\n')
+
+        file.write('\n')
         file.write(f'{INDENTATION}@abstractmethod')
         file.write('\n')
         file.write(f'{INDENTATION}def accept(self, visitor: {visitor}):')
@@ -116,8 +144,10 @@ def main() -> None:
     if not path.is_dir():
         arg_parser.error('output must be a valid directory')
 
-    define_ast(path / 'expressions.py', 'Expr', EXPRESSIONS, EXPRESSIONS_IMPORTS)
-    define_ast(path / 'statements.py', 'Stmt', STATEMENTS, STATEMENTS_IMPORTS)
+    define_ast(path / 'expressions.py', 'Expr', EXPRESSIONS, EXPRESSIONS_IMPORTS,
+               EXPRESSIONS_ATTRIBUTES)
+    define_ast(path / 'statements.py', 'Stmt', STATEMENTS, STATEMENTS_IMPORTS,
+               STATEMENTS_ATTRIBUTES)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,77 @@
+import json
+import resource
+from argparse import ArgumentParser
+from os import devnull
+from pathlib import Path
+from random import Random
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from lox.records import BATCH_SIZE, BUFFER_SIZE, FORMATS, MODES, RecordFilter, parse_expression
+
+arg_parser = ArgumentParser(usage='python -m tools.records_bench [options]')
+arg_parser.add_argument('--records', type=int, default=1_000_000,
+                        help='Number of generated records. Default: 1000000')
+arg_parser.add_argument('--format', choices=FORMATS, default='jsonl',
+                        help='Input format. Default: jsonl')
+arg_parser.add_argument('--mode', choices=MODES, default='filter',
+                        help='Filter records or map them to a value. Default: filter')
+arg_parser.add_argument('--expression', default='price * quantity > 250 == !discounted',
+                        help='Lox expression evaluated per record.')
+arg_parser.add_argument('--batch-size', type=int, default=BATCH_SIZE,
+                        help=f'Records per batch. Default: {BATCH_SIZE}')
+arg_parser.add_argument('--input', help='Existing input file; skips generation.')
+
+
+def generate(path: Path, records: int, fmt: str) -> None:
+    rng = Random(0)
+
+    with path.open('w', encoding='utf-8', newline='', buffering=BUFFER_SIZE) as stream:
+        if fmt == 'csv':
+            stream.write('id,name,price,quantity,discounted\n')
+
+        for index in range(records):
+            price = round(rng.uniform(1, 100), 2)
+            quantity = rng.randrange(10)
+            discounted = rng.random() < 0.3
+
+            if fmt == 'csv':
+                stream.write(f'{index},item{index},{price},{quantity},{int(discounted)}\n')
+            else:
+                record = {'id': index, 'name': f'item{index}', 'price': price,
+                          'quantity': quantity, 'discounted': discounted}
+                stream.write(json.dumps(record) + '\n')
+
+
+def measure(path: Path, args) -> None:
+    record_filter = RecordFilter(parse_expression(args.expression), args.mode, args.batch_size)
+    size = path.stat().st_size
+
+    with path.open(encoding='utf-8', newline='', buffering=BUFFER_SIZE) as source, \
+            open(devnull, 'w', encoding='utf-8', newline='') as sink:
+        started = perf_counter()
+        records = record_filter.run(source, sink, args.format)
+        elapsed = perf_counter() - started
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    print(f'{records:,} records, {size / 1e6:,.1f} MB in {elapsed:.2f} s: '
+          f'{records / elapsed:,.0f} records/s, {size / elapsed / 1e6:.1f} MB/s, '
+          f'peak RSS {peak:.1f} MB')
+
+
+def main() -> None:
+    args = arg_parser.parse_args()
+
+    if args.input:
+        measure(Path(args.input), args)
+        return
+
+    with TemporaryDirectory() as directory:
+        path = Path(directory) / f'records.{args.format}'
+        generate(path, args.records, args.format)
+        measure(path, args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,497 @@
+import asyncio
+from argparse import ArgumentParser
+from io import StringIO
+from random import Random
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from lox.aio import AsyncInterpreter
+from lox.arena import ArenaInterpreter, parse_arena
+from lox.cse import MemoizingInterpreter
+from lox.environment import Environment
+from lox.errors import LoxRuntimeError
+from lox.expressions import Expr
+from lox.inference import TypedInterpreter
+from lox.interning import InterningInterpreter, parse_interned
+from lox.interpreter import Interpreter
+from lox.parallel import parse_parallel
+from lox.parser import Parser
+from lox.program import Program, compile
+from lox.scanner import Scanner
+from lox.statements import Print
+
+arg_parser = ArgumentParser(usage='python -m tools.stress [options]')
+arg_parser.add_argument('--programs', type=int, default=200,
+                        help='Number of random programs to generate. Default: 200')
+arg_parser.add_argument('--statements', type=int, default=50,
+                        help='Statements per program. Default: 50')
+arg_parser.add_argument('--depth', type=int, default=4,
+                        help='Maximum expression nesting depth. Default: 4')
+arg_parser.add_argument('--error-rate', type=float, default=0.002,
+                        help='Chance of an ill-typed operand per node. Default: 0.002')
+arg_parser.add_argument('--seed', type=int, default=0,
+                        help='Random seed. Default: 0')
+arg_parser.add_argument('--show', type=int, default=5,
+                        help='Maximum number of mismatching programs to print. Default: 5')
+
+Outcome = Tuple[str, Optional[Tuple[str, str, int]]]
+Engine = Callable[[Program, Dict[str, Any]], Outcome]
+
+VARIABLES: Dict[str, Any] = {
+    'a': 3,
+    'b': -7,
+    'x': 2.5,
+    'name': 'lox',
+    'flag': True,
+    'empty': '',
+}
+
+COLUMNS: Dict[str, List[Any]] = {
+    'a': [3, 0, -2, 12],
+    'b': [-7, 4, 1, 5],
+    'x': [2.5, -1.0, 0.5, 3.0],
+    'name': ['lox', '', 'a', 'hello world'],
+    'flag': [True, False, False, True],
+    'empty': ['', 'x', '', 'lox'],
+}
+
+MIXED_COLUMNS: Tuple[Dict[str, List[Any]], ...] = (
+    {'a': [1, 'a', 2, 'b']},
+    {'a': [True, 2, False, 3]},
+    {'x': [1, 2.5, 3, 0.5]},
+    {'name': ['lox', 3, None, True]},
+)
+
+COLUMN_EXPRESSIONS: Tuple[str, ...] = ('a', 'a + a', '-a', 'a * 2', 'a == 1', '!a', 'x', 'x + x', 'name')
+
+OVERFLOW_COLUMNS: Tuple[Dict[str, List[Any]], ...] = (
+    {'a': [2 ** 40, 3], 'b': [2 ** 40, -2 ** 40]},
+    {'a': [2 ** 62, -2 ** 62], 'b': [2 ** 62, 2 ** 62]},
+    {'a': [2 ** 63, 1], 'b': [1, 2]},
+    {'a': [-2 ** 63, 0], 'b': [1, 1]},
+)
+
+OVERFLOW_EXPRESSIONS: Tuple[str, ...] = ('a * a', 'a + b', 'a - b', '-a', 'a * b * a')
+
+KINDS: Tuple[str, ...] = ('number', 'string', 'bool', 'null')
+
+NUMERIC_OPERATORS: Tuple[str, ...] = ('+', '-', '*', '/')
+
+COMPARISON_OPERATORS: Tuple[str, ...] = ('>', '>=', '<', '<=')
+
+EQUALITY_OPERATORS: Tuple[str, ...] = ('==', '!=')
+
+BINARY_OPERATORS: Tuple[str, ...] = NUMERIC_OPERATORS + COMPARISON_OPERATORS + EQUALITY_OPERATORS
+
+STRINGS: Tuple[str, ...] = ('', 'a', 'lox', 'hello world', 'a;b', '(;', ')', '// not a comment', 'two\nlines;\n')
+
+COMMENTS: Tuple[str, ...] = ('//', '// a; b', '// unbalanced ( and "', "// it's ;)", '// print 1;')
+
+
+class ProgramGenerator:
+    def __init__(self, rng: Random, depth: int, error_rate: float) -> None:
+        self.rng = rng
+        self.depth = depth
+        self.error_rate = error_rate
+        self.variables: Dict[str, List[str]] = {kind: [] for kind in KINDS}
+
+        for name, value in VARIABLES.items():
+            if isinstance(value, str):
+                self.variables['string'].append(name)
+            elif isinstance(value, bool):
+                self.variables['bool'].append(name)
+            elif isinstance(value, (int, float)):
+                self.variables['number'].append(name)
+
+    def literal(self, kind: str) -> str:
+        if self.variables[kind] and self.rng.random() < 0.3:
+            return self.rng.choice(self.variables[kind])
+
+        if kind == 'number':
+            if self.rng.random() < 0.5:
+                return str(self.rng.randrange(10))
+
+            return f'{self.rng.randrange(10)}.{self.rng.randrange(1, 10)}'
+        elif kind == 'string':
+            quote = self.rng.choice(('"', "'"))
+            return f'{quote}{self.rng.choice(STRINGS)}{quote}'
+        elif kind == 'bool':
+            return self.rng.choice(('true', 'false'))
+
+        return 'null'
+
+    def expression(self, kind: str, depth: int = 0) -> str:
+        if self.rng.random() < self.error_rate:
+            kind = self.rng.choice(KINDS)
+
+        if depth >= self.depth or kind == 'null' or self.rng.random() < 0.25:
+            return self.literal(kind)
+
+        if self.rng.random() < 0.15:
+            return f'({self.expression(kind, depth + 1)})'
+
+        if kind == 'number':
+            if self.rng.random() < 0.2:
+                return self.unary('-', kind, depth)
+
+            operator = self.rng.choice(NUMERIC_OPERATORS)
+
+            if operator == '/':
+                divisor = f'{self.rng.randrange(1, 10)}.{self.rng.randrange(10)}'
+                return f'{self.expression(kind, depth + 1)} / {divisor}'
+
+            return self.binary('number', operator, 'number', depth)
+        elif kind == 'string':
+            return self.binary('string', '+', 'string', depth)
+
+        choice = self.rng.randrange(3)
+
+        if choice == 0:
+            return self.unary('!', self.rng.choice(KINDS), depth)
+        elif choice == 1:
+            operator = self.rng.choice(COMPARISON_OPERATORS)
+            return self.binary('number', operator, 'number', depth)
+
+        operator = self.rng.choice(EQUALITY_OPERATORS)
+        return self.binary(self.rng.choice(KINDS), operator, self.rng.choice(KINDS), depth)
+
+    def unary(self, operator: str, kind: str, depth: int) -> str:
+        operand = self.expression(kind, depth + 1)
+
+        if ' ' in operand:
+            return f'{operator}({operand})'
+
+        return f'{operator}{operand}'
+
+    def binary(self, left: str, operator: str, right: str, depth: int) -> str:
+        return f'{self.expression(left, depth + 1)} {operator} {self.expression(right, depth + 1)}'
+
+    def statement(self) -> str:
+        expression = self.expression(self.rng.choice(KINDS))
+        statement = f'print {expression};' if self.rng.random() < 0.8 else f'{expression};'
+        choice = self.rng.random()
+
+        if choice < 0.05:
+            return f'{self.rng.choice(COMMENTS)}\n{statement}'
+        elif choice < 0.1:
+            return f'{statement} {self.rng.choice(COMMENTS)}'
+
+        return statement
+
+    def program(self, size: int) -> str:
+        return '\n'.join(self.statement() for _ in range(size)) + '\n'
+
+
+def outcome(output: str, error: Optional[BaseException]) -> Outcome:
+    if error is None:
+        return output, None
+
+    start = error.token.start if isinstance(error, LoxRuntimeError) else -1
+    return output, (type(error).__name__, str(error), start)
+
+
+def run_interpreter(program: Program, env: Dict[str, Any]) -> Outcome:
+    output = StringIO()
+    interpreter = Interpreter(Environment(dict(env)), output)
+
+    try:
+        interpreter.interpret(program.statements)
+    except (LoxRuntimeError, ArithmeticError) as error:
+        return outcome(output.getvalue(), error)
+
+    return outcome(output.getvalue(), None)
+
+
+def run_budgeted(program: Program, env: Dict[str, Any]) -> Outcome:
+    output = StringIO()
+    interpreter = Interpreter(Environment(dict(env)), output,
+                              max_steps=10 ** 12, timeout=3600.0, check_interval=7)
+
+    try:
+        interpreter.interpret(program.statements)
+    except (LoxRuntimeError, ArithmeticError) as error:
+        return outcome(output.getvalue(), error)
+
+    return outcome(output.getvalue(), None)
+
+
+class CollectingStream:
+    def __init__(self) -> None:
+        self.chunks: List[bytes] = []
+
+    def write(self, data: bytes) -> None:
+        self.chunks.append(data)
+
+    async def drain(self) -> None:
+        pass
+
+    def getvalue(self) -> str:
+        return b''.join(self.chunks).decode('utf-8')
+
+
+def run_async(program: Program, env: Dict[str, Any]) -> Outcome:
+    stream = CollectingStream()
+    interpreter = AsyncInterpreter(Environment(dict(env)), stream, yield_interval=3)
+
+    try:
+        asyncio.run(interpreter.interpret_async(program.statements))
+    except (LoxRuntimeError, ArithmeticError) as error:
+        return outcome(stream.getvalue(), error)
+
+    return outcome(stream.getvalue(), None)
+
+
+def run_memoized(program: Program, env: Dict[str, Any]) -> Outcome:
+    output = StringIO()
+    interpreter = MemoizingInterpreter(program.statements, Environment(dict(env)), output)
+
+    try:
+        interpreter.interpret()
+    except (LoxRuntimeError, ArithmeticError) as error:
+        return outcome(output.getvalue(), error)
+
+    return outcome(output.getvalue(), None)
+
+
+def run_typed(program: Program, env: Dict[str, Any]) -> Outcome:
+    output = StringIO()
+    interpreter = TypedInterpreter(program.statements, Environment(dict(env)), output)
+
+    try:
+        interpreter.interpret()
+    except (LoxRuntimeError, ArithmeticError) as error:
+        return outcome(output.getvalue(), error)
+
+    return outcome(output.getvalue(), None)
+
+
+def run_arena(program: Program, env: Dict[str, Any]) -> Outcome:
+    output = StringIO()
+    interpreter = ArenaInterpreter(parse_arena(program.source), Environment(dict(env)), output)
+
+    try:
+        interpreter.interpret_arena()
+    except (LoxRuntimeError, ArithmeticError) as error:
+        return outcome(output.getvalue(), error)
+
+    return outcome(output.getvalue(), None)
+
+
+def run_arena_adapter(program: Program, env: Dict[str, Any]) -> Outcome:
+    adapted = Program(program.source, tuple(parse_arena(program.source).to_statements()))
+    return run_interpreter(adapted, env)
+
+
+def run_parallel(program: Program, env: Dict[str, Any]) -> Outcome:
+    stmts = parse_parallel(program.source, workers=2, min_chunk_size=64)
+    return run_interpreter(Program(program.source, tuple(stmts)), env)
+
+
+def run_interned(program: Program, env: Dict[str, Any]) -> Outcome:
+    stmts, factory = parse_interned(program.source)
+    output = StringIO()
+    interpreter = InterningInterpreter(factory, Environment(dict(env)), output)
+
+    try:
+        interpreter.interpret(stmts)
+    except (LoxRuntimeError, ArithmeticError) as error:
+        return outcome(output.getvalue(), error)
+
+    return outcome(output.getvalue(), None)
+
+
+def run_vectorized(program: Program, env: Dict[str, Any]) -> Outcome:
+    from lox.vectorized import VectorizedEvaluator
+
+    columns = {name: [value] for name, value in env.items()}
+    evaluator = VectorizedEvaluator(columns)
+    output = StringIO()
+
+    for stmt in program.statements:
+        try:
+            value = evaluator.evaluate(stmt.expression).tolist()[0]
+        except (LoxRuntimeError, ArithmeticError) as error:
+            return outcome(output.getvalue(), error)
+
+        if isinstance(stmt, Print):
+            print(Interpreter.stringify(value), file=output)
+
+    return outcome(output.getvalue(), None)
+
+
+ColumnOutcome = List[Any]
+
+
+def evaluate_rows(expr: Expr, columns: Dict[str, List[Any]]) -> ColumnOutcome:
+    size = len(next(iter(columns.values())))
+    values = []
+
+    columns = {name: column if isinstance(column, list) else column.tolist()
+               for name, column in columns.items()}
+
+    for index in range(size):
+        row = {name: column[index] for name, column in columns.items()}
+
+        try:
+            value = Interpreter(Environment(row)).evaluate(expr)
+        except (LoxRuntimeError, ArithmeticError) as error:
+            return [outcome('', error)[1]]
+
+        values.append(Interpreter.stringify(value))
+
+    return values
+
+
+def evaluate_vectorized(expr: Expr, columns: Dict[str, List[Any]]) -> ColumnOutcome:
+    from lox.vectorized import VectorizedEvaluator
+
+    try:
+        values = VectorizedEvaluator(columns).evaluate(expr).tolist()
+    except (LoxRuntimeError, ArithmeticError) as error:
+        return [outcome('', error)[1]]
+
+    return [Interpreter.stringify(value) for value in values]
+
+
+def typed_column_cases() -> List[Tuple[str, Dict[str, Any]]]:
+    import numpy
+
+    return [
+        ('a - b', {'a': numpy.array([0, 1, 200], dtype=numpy.uint8),
+                   'b': numpy.array([1, 0, 100], dtype=numpy.uint8)}),
+        ('-a', {'a': numpy.array([5, 0, 4000000000], dtype=numpy.uint32)}),
+        ('a + a', {'a': numpy.array([2 ** 63, 1, 2], dtype=numpy.uint64)}),
+        ('a * a', {'a': numpy.array([100, -128, 127], dtype=numpy.int8)}),
+        ('-a', {'a': numpy.array([-128, 0, 127], dtype=numpy.int8)}),
+        ('a * b', {'a': numpy.array([300, -300, 7], dtype=numpy.int16),
+                   'b': numpy.array([300, 300, -7], dtype=numpy.int16)}),
+        ('x + x', {'x': numpy.array([0.1, 3.5, -1e30], dtype=numpy.float32)}),
+        ('x * 3', {'x': numpy.array([0.1, 2.5, 1e38], dtype=numpy.float32)}),
+        ('a + x', {'a': numpy.array([1, 2, 255], dtype=numpy.uint8),
+                   'x': numpy.array([0.5, 0.25, 0.1], dtype=numpy.float16)}),
+    ]
+
+
+def check_columns(sources: List[str], show: int) -> int:
+    cases = [(source, compile(source, cache=False).statements, columns)
+             for source in sources
+             for columns in (COLUMNS,) + tuple({**COLUMNS, **mixed} for mixed in MIXED_COLUMNS)]
+    cases.extend((expression, compile(f'{expression};', cache=False).statements, {**COLUMNS, **mixed})
+                 for expression in COLUMN_EXPRESSIONS
+                 for mixed in MIXED_COLUMNS)
+    cases.extend((expression, compile(f'{expression};', cache=False).statements, columns)
+                 for expression in OVERFLOW_EXPRESSIONS
+                 for columns in OVERFLOW_COLUMNS)
+    cases.extend((expression, compile(f'{expression};', cache=False).statements, columns)
+                 for expression, columns in typed_column_cases())
+    mismatches = 0
+
+    for source, stmts, columns in cases:
+        for stmt in stmts:
+            expected = evaluate_rows(stmt.expression, columns)
+            actual = evaluate_vectorized(stmt.expression, columns)
+
+            if actual == expected:
+                continue
+
+            mismatches += 1
+
+            if mismatches <= show:
+                print('Mismatch in engine \'vectorized\' over columns:', source, columns,
+                      f'interpreter: {expected!r}', f'vectorized: {actual!r}', sep='\n')
+
+    return mismatches
+
+
+def engines() -> Dict[str, Engine]:
+    available: Dict[str, Engine] = {
+        'budgeted': run_budgeted,
+        'async': run_async,
+        'memoized': run_memoized,
+        'typed': run_typed,
+        'arena': run_arena,
+        'arena-adapter': run_arena_adapter,
+        'interned': run_interned,
+        'parallel': run_parallel,
+    }
+
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        available['vectorized'] = run_vectorized
+
+    return available
+
+
+def throughput(sources: List[str]) -> None:
+    total_bytes = sum(len(source) for source in sources)
+    token_count = 0
+    node_count = 0
+
+    started = perf_counter()
+    token_lists = []
+
+    for source in sources:
+        tokens = Scanner(source).scan_tokens()
+        token_count += len(tokens)
+        token_lists.append(tokens)
+
+    scanned = perf_counter()
+
+    for tokens in token_lists:
+        node_count += len(Parser(tokens).parse())
+
+    parsed = perf_counter()
+
+    scan_time = scanned - started
+    parse_time = parsed - scanned
+
+    print(f'Scanner: {total_bytes / scan_time / 1e6:.2f} MB/s, '
+          f'{token_count / scan_time:,.0f} tokens/s')
+    print(f'Parser:  {token_count / parse_time:,.0f} tokens/s, '
+          f'{node_count / parse_time:,.0f} statements/s')
+
+
+def main() -> None:
+    args = arg_parser.parse_args()
+    rng = Random(args.seed)
+    generator = ProgramGenerator(rng, args.depth, args.error_rate)
+    sources = [generator.program(args.statements) for _ in range(args.programs)]
+    others = engines()
+    mismatches = 0
+
+    for source in sources:
+        program = compile(source, cache=False)
+        expected = run_interpreter(program, VARIABLES)
+
+        for name, engine in others.items():
+            actual = engine(program, VARIABLES)
+
+            if actual == expected:
+                continue
+
+            mismatches += 1
+
+            if mismatches <= args.show:
+                print(f'Mismatch in engine {name!r}:', source,
+                      f'interpreter: {expected!r}', f'{name}: {actual!r}', sep='\n')
+
+    print(f'Checked {len(sources)} programs against {", ".join(others) or "no other engines"}: '
+          f'{mismatches} mismatches')
+
+    if 'vectorized' in others:
+        column_mismatches = check_columns(sources, args.show)
+        mismatches += column_mismatches
+        print(f'Checked multi-row and mixed-type columns against vectorized: '
+              f'{column_mismatches} mismatches')
+
+    throughput(sources)
+
+    if mismatches:
+        exit(1)
+
+
+if __name__ == '__main__':
+    main()